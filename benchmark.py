@@ -0,0 +1,216 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import matplotlib
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from cache import code_version
+from charts import CHARTS
+from cleaning import (drop_index_columns, parse_price, split_detail, parse_dates, add_year_month, mission_status_int,
+                      clean_launches)
+from cube import LaunchCube
+from ingest import CHUNKSIZE, read_chunks
+from pipeline import AGGREGATES
+from prices import impute_prices
+from reliability import RELIABILITY_KEYS, rolling_reliability
+from states import country_code, resolve_states, resolve_country_codes, state_of_location
+from synthetic import generate, write_csv
+
+SIZES = [10 ** 4, 10 ** 5]
+
+# Text summary of main.py in new interpreter, including imports and load of cached data
+STARTUP_ARGS = ["--summary", "launches_per_organisation", "active_retired_rockets"]
+STARTUP_BUDGET = 1.5
+# Modules that text summary must not import
+PLOTTING_MODULES = ["plotly", "matplotlib"]
+
+
+def measure(func, *args, memory=True, setup=None):
+    """Run func and return its result, wall time in seconds and peak of allocated memory in bytes.
+
+    Memory is measured in second run, tracemalloc would slow down the timed one.
+    setup is called before every run, e.g. to empty caches.
+    """
+    if setup is not None:
+        setup()
+    start = time.perf_counter()
+    result = func(*args)
+    seconds = time.perf_counter() - start
+
+    peak = None
+    if memory:
+        if setup is not None:
+            setup()
+        tracemalloc.start()
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, seconds, peak
+
+
+def clear_caches():
+    # Lookups per unique location and state are cached for the whole process, every timed run starts cold
+    state_of_location.cache_clear()
+    country_code.cache_clear()
+
+
+def cleaning_stages(raw):
+    # Every cleaning step alone, on the same input as in cleaning.clean_launches
+    frame = drop_index_columns(raw)
+    states = resolve_states(frame["Location"], errors="ignore")
+    return {
+        "state_mapping": (resolve_states, frame["Location"], "ignore"),
+        "iso_lookup": (resolve_country_codes, states),
+        "price_parsing": (parse_price, frame["Price"]),
+        "detail_split": (split_detail, frame),
+        "date_parsing": (parse_dates, frame["Date"]),
+        "mission_status_int": (mission_status_int, frame["Mission_Status"]),
+    }
+
+
+def frames(rows, seed=0, chunksize=CHUNKSIZE):
+    # Raw synthetic launches, sizes over chunksize are streamed through csv file and never are in memory whole
+    if rows <= chunksize:
+        yield generate(rows, seed)
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "launches.csv")
+        write_csv(path, rows, seed, chunksize)
+        yield from read_chunks(path, chunksize)
+
+
+def run(rows, seed=0, memory=True, charts=True, chunksize=CHUNKSIZE):
+    """Times and memory peaks of every stage on rows of synthetic launches.
+
+    Over chunksize rows every stage runs chunk by chunk, times are summed and peaks are the largest of one chunk.
+    Aggregates run on the merged cube, charts need the whole frame and are built only when it fits in one chunk.
+    """
+    timings = {}
+
+    def record(stage, func, *args, setup=clear_caches):
+        result, seconds, peak = measure(func, *args, memory=memory, setup=setup)
+        item = timings.setdefault(stage, {"rows": rows, "stage": stage, "seconds": 0.0, "peak_bytes": None})
+        item["seconds"] += seconds
+        if peak is not None:
+            item["peak_bytes"] = max(item["peak_bytes"] or 0, peak)
+        return result
+
+    cube = LaunchCube()
+    chunks = 0
+    for raw in frames(rows, seed, chunksize):
+        chunks += 1
+        for stage, (func, *args) in cleaning_stages(raw).items():
+            record(stage, func, *args)
+        record("price_imputation", impute_prices, clean_launches(raw, price_strategy=None))
+        cleared_data = record("clean_launches", clean_launches, raw)
+        record("year_month", add_year_month, cleared_data.copy())
+        cube.merge(record("cube", LaunchCube.from_frame, cleared_data))
+        for name, column in RELIABILITY_KEYS.items():
+            record(f"reliability:{name}", rolling_reliability, cleared_data, column)
+
+    def cold_cube():
+        # Geo table is memoized in the cube
+        clear_caches()
+        cube._geo = None
+
+    for name, func in AGGREGATES.items():
+        record(f"aggregate:{name}", func, cube, setup=cold_cube)
+
+    if charts and chunks == 1:
+        matplotlib.use("Agg")
+        for name, build in CHARTS.items():
+            record(f"chart:{name}", build, cleared_data, cube)
+            plt.close("all")
+    return list(timings.values())
+
+
+def startup(args=STARTUP_ARGS, repeat=5):
+    """Best wall time of main.py with args in new interpreter and plotting modules it imported.
+
+    The first run is not measured, it creates the cache of cleaned data. Enforced by tests/test_startup.py.
+    """
+    code = ("import json, runpy, sys\n"
+            f"sys.argv = ['main.py'] + {list(args)!r}\n"
+            "runpy.run_path('main.py', run_name='__main__')\n"
+            f"print(json.dumps([name for name in {PLOTTING_MODULES!r} if name in sys.modules]))")
+    command = [sys.executable, "-c", code]
+    here = os.path.dirname(os.path.abspath(__file__))
+    subprocess.run(command, check=True, capture_output=True, cwd=here)
+
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = subprocess.run(command, check=True, capture_output=True, text=True, cwd=here).stdout
+        seconds.append(time.perf_counter() - start)
+    return min(seconds), json.loads(output.strip().splitlines()[-1])
+
+
+def compare(results, baseline, tolerance):
+    # Stages slower than baseline by more than tolerance, e.g. 0.2 = 20 %
+    old = {(item["rows"], item["stage"]): item["seconds"] for item in baseline["results"]}
+    slower = []
+    for item in results:
+        before = old.get((item["rows"], item["stage"]))
+        if before and item["seconds"] > before * (1 + tolerance):
+            slower.append({**item, "baseline_seconds": before, "ratio": item["seconds"] / before})
+    return slower
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of cleaning, aggregations and charts on synthetic data")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="numbers of rows, 10^4 to 10^8")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip memory profiling")
+    parser.add_argument("--no-charts", action="store_true", help="skip figure builds")
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE,
+                        help="larger sizes are streamed through csv file in chunks of this many rows")
+    parser.add_argument("--output", default="benchmark.json", help="json file with results")
+    parser.add_argument("--baseline", help="json file of earlier run, regressions are reported")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--startup", action="store_true",
+                        help="only check start-up time of text summary, fails over --startup-budget or "
+                             "when it imports plotting modules")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET, help="seconds")
+    args = parser.parse_args()
+
+    if args.startup:
+        seconds, imported = startup()
+        print(f"main.py {' '.join(STARTUP_ARGS)}: {seconds:.3f} s (budget {args.startup_budget} s), "
+              f"plotting modules imported: {imported}")
+        if seconds > args.startup_budget or imported:
+            raise SystemExit(1)
+        raise SystemExit(0)
+
+    report = {
+        "code_version": code_version(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "results": [],
+    }
+    for size in args.sizes:
+        results = run(size, args.seed, memory=not args.no_memory, charts=not args.no_charts, chunksize=args.chunksize)
+        report["results"] += results
+        for item in results:
+            peak = "" if item["peak_bytes"] is None else f"{item['peak_bytes'] / 2 ** 20:>10.1f} MB"
+            print(f"{item['rows']:>10} {item['stage']:<45}{item['seconds']:>10.4f} s {peak}")
+
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(report["results"], json.load(file), args.tolerance)
+        for item in regressions:
+            print(f"Slower: {item['rows']} {item['stage']} {item['baseline_seconds']:.4f} s -> "
+                  f"{item['seconds']:.4f} s ({item['ratio']:.2f}x)")
+        if regressions:
+            raise SystemExit(1)
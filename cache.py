@@ -0,0 +1,120 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from cleaning import clean_launches
+from compact import compact, expand
+from prices import DEFAULT_PRICE_STRATEGY
+
+try:
+    from pyarrow import feather
+except ImportError:          # Without pyarrow data is always cleaned from csv
+    feather = None
+
+CACHE_DIR = ".cache"
+
+# Change of any of these files makes the cache invalid
+CODE_FILES = ["cleaning.py", "states.py", "prices.py", "compact.py", "cache.py"]
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def code_version():
+    here = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for name in CODE_FILES:
+        digest.update(_file_hash(os.path.join(here, name)).encode())
+    return digest.hexdigest()
+
+
+def _paths(source, cache_dir):
+    # Same file names in other directories get their own cache files
+    source_id = hashlib.sha256(os.path.abspath(source).encode()).hexdigest()[:12]
+    name = f"{os.path.splitext(os.path.basename(source))[0]}-{source_id}"
+    return os.path.join(cache_dir, f"{name}.feather"), os.path.join(cache_dir, f"{name}.json")
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(meta_path, meta):
+    with open(meta_path, "w") as file:
+        json.dump(meta, file, indent=2)
+
+
+def is_valid(source, cache_dir=CACHE_DIR, params=None):
+    # params are options of cleaning, e.g. price strategy, cache made with other ones is not valid
+    data_path, meta_path = _paths(source, cache_dir)
+    meta = _read_meta(meta_path)
+    if meta is None or not os.path.exists(data_path) or meta["code_version"] != code_version():
+        return False
+    if meta.get("params") != (params or {}):
+        return False
+
+    stat = os.stat(source)
+    if meta["size"] != stat.st_size:
+        return False
+    if meta["mtime_ns"] == stat.st_mtime_ns:
+        return True
+
+    # File was touched, it is still valid when the content is the same
+    if meta["sha256"] != _file_hash(source):
+        return False
+    meta["mtime_ns"] = stat.st_mtime_ns
+    _write_meta(meta_path, meta)
+    return True
+
+
+def load_cached(source, cache_dir=CACHE_DIR, categorical=False, params=None):
+    """Cleaned DataFrame from cache or None when there is no valid cache.
+
+    The file is memory mapped. categorical=False decodes compact.compact dtypes back to str and int64.
+    """
+    if feather is None or not is_valid(source, cache_dir, params):
+        return None
+    data_path, _ = _paths(source, cache_dir)
+    frame = feather.read_table(data_path, memory_map=True).to_pandas()
+    return frame if categorical else expand(frame)
+
+
+def save_cache(frame, source, cache_dir=CACHE_DIR, params=None):
+    if feather is None:
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    data_path, meta_path = _paths(source, cache_dir)
+
+    # Columns are stored dictionary encoded. Uncompressed, so the file can be memory mapped on load
+    feather.write_feather(compact(frame), data_path, compression="uncompressed")
+
+    stat = os.stat(source)
+    _write_meta(meta_path, {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": _file_hash(source),
+        "code_version": code_version(),
+        "params": params or {},
+    })
+
+
+def load_or_clean(source, cache_dir=CACHE_DIR, categorical=False, price_strategy=DEFAULT_PRICE_STRATEGY):
+    params = {"price_strategy": price_strategy}
+    frame = load_cached(source, cache_dir, categorical, params)
+    if frame is None:
+        frame = clean_launches(pd.read_csv(source), price_strategy)
+        save_cache(frame, source, cache_dir, params)
+        if categorical:
+            frame = compact(frame)
+    return frame
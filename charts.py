@@ -0,0 +1,327 @@
+import importlib
+
+import numpy as np
+import pandas as pd
+
+from downsample import binned, decimate
+
+
+class _LazyModule:
+    """Module imported on first use of its attribute.
+
+    plotly and matplotlib take most of the start-up time, they are loaded only when a chart is built.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+
+px = _LazyModule("plotly.express")
+go = _LazyModule("plotly.graph_objects")
+plt = _LazyModule("matplotlib.pyplot")
+
+# Filter params for cold war charts
+COLD_WAR_STATES = ["USA", "Russian Federation"]
+COLD_WAR_LAST_YEAR = 1991
+
+SOURCE_ANNOTATION = dict(x=0.55,
+                         y=0.1,
+                         xref="paper",
+                         yref='paper',
+                         text='Source: <a href="https://colab.research.google.com/drive/'
+                              '1YpZRVy16KqLuKvqJifzukBT2TQMj8VX1#scrollTo=xdolY0-Sa-p1">'
+                              'Space_Missions_Analysis</a>',
+                         showarrow=True
+                         )
+
+
+def _map_layout(figure, title):
+    figure.update_layout(title_text=title,
+                         geo=dict(showframe=True,
+                                  showcoastlines=True,
+                                  projection_type='equirectangular'),
+                         annotations=[SOURCE_ANNOTATION]
+                         )
+    return figure
+
+
+def _cold_war_cube(cube):
+    return cube.select(States=COLD_WAR_STATES, Year=slice(None, COLD_WAR_LAST_YEAR))
+
+
+# --------------------------------Distribution of prices------------------------------------
+def price_histogram(cleared_data, cube):
+    counts, edges = binned(cleared_data["Price"], bins=54)
+
+    figure, axes = plt.subplots(figsize=(9, 6))
+    axes.stairs(counts, edges, fill=True)
+    axes.set_title("Price")
+    return figure
+
+
+# ------------------Histogram average Price per launch by organisation-----------------
+def price_per_organisation(cleared_data, cube):
+    grouped_df = cube.price_mean("Organisation").reset_index()
+
+    figure, axes = plt.subplots()
+    axes.bar(grouped_df["Organisation"], grouped_df["Price"])
+    axes.set_xlabel('Organisation')
+    plt.setp(axes.get_xticklabels(), rotation=45, ha="right")
+    axes.set_ylabel("Price per launch")
+    axes.set_title("Histogram of average prices per launches by organisations")
+    return figure
+
+
+# ------------------------------Launches per state map --------------------------------------------------------
+# Locations and values of the maps come from one table keyed by ISO-3 code, see LaunchCube.geo
+def launches_per_state(cleared_data, cube):
+    geo = cube.geo()
+    figure = go.Figure(data=go.Choropleth(
+                           locations=geo.index,
+                           z=geo["Launches"],
+                           text=geo["State"],
+                           colorscale="Blues",
+                           autocolorscale=True,
+                           reversescale=False,
+                           )
+                       )
+    return _map_layout(figure, "Launches per State")
+
+
+# ----------------------Failure per state map----------------------------
+def fails_per_state(cleared_data, cube):
+    geo = cube.geo()
+    figure = go.Figure(data=go.Choropleth(
+                           locations=geo.index,
+                           z=geo["Failures"],
+                           text=geo["State"],
+                           colorscale="Reds",
+                           autocolorscale=True,
+                           reversescale=True
+                           )
+                       )
+    return _map_layout(figure, "Fails per state")
+
+
+# -------SunBurst chart of the countries, organisations, and mission status--------
+def state_organisation_sunburst(cleared_data, cube):
+    # Sum of Mission_Status_Int: 2 for each success, 1 for each failure
+    state_org_status = cube.rollup(["States", "Organisation", "Mission_Status"]).reset_index()
+    state_org_status["Mission_Status_Int"] = state_org_status["Launches"] * np.where(
+        state_org_status["Mission_Status"] == "Success", 2, 1)
+
+    figure = px.sunburst(state_org_status,
+                         path=["States", "Organisation", "Mission_Status"],
+                         values="Mission_Status_Int",
+                         branchvalues="total",
+                         )
+    figure.update_layout(title="Launches per state and company, Successes/failures")
+    return figure
+
+
+# ----------Money spend by organisations on space missions-------------.
+def money_per_organisation(cleared_data, cube):
+    price_per_comp = cube.price_sum("Organisation").reset_index()
+
+    figure = px.sunburst(price_per_comp,
+                         path=["Organisation"],
+                         values="Price_Sum",
+                         branchvalues="total",)
+    figure.update_layout(title="Money spend by organisation on space missions")
+    return figure
+
+
+# ---------------------------Launches over years---------------------------------
+def launches_over_years(cleared_data, cube):
+    launches = decimate(cube.rollup(["Year", "States"]).reset_index(), "Year", "Launches", "States")
+    return px.line(launches,
+                   x="Year",
+                   y="Launches",
+                   color="States",
+                   markers=True,
+                   title="Number of launches per Organisation over years",
+                   labels={"Year": 'Year', 'States': "State",
+                           "Launches": 'Number of Launches'})
+
+
+# ----------------Number of launches per month-------------------
+def monthly_launches(cleared_data, cube):
+    # The most popular months are : Jun, July, August
+    # Least popular are winter months: December, January, February
+    launches = cube.rollup(["Month", "States"]).reset_index()
+    return px.line(launches,
+                   x="Month",
+                   y="Launches",
+                   color="States",
+                   markers=True,
+                   title="Number of launches per state over months",
+                   labels={"Month": 'Month',
+                           "States": "State",
+                           "Launches": "Number of Launches"})
+
+
+# ---------------Launch price over time-------------
+def price_over_time(cleared_data, cube):
+    # Problem with this chart is: a Lot of price data was Nan. I supplied it with: Average price in missing years
+    # Not missing values suggest that price per launch over years are descending.
+    # Average price of launch per month
+    monthly = cube.rollup(["Year", "Month"]).reset_index()
+    monthly["Date"] = pd.to_datetime(dict(year=monthly["Year"], month=monthly["Month"], day=1))
+    monthly["Price"] = monthly["Price_Sum"] / monthly["Launches"]
+
+    return px.line(decimate(monthly, "Date", "Price"),
+                   x="Date",
+                   y="Price",
+                   markers=False,
+                   title="Price per Launch over time",
+                   )
+
+
+# -----------------Number of launches over tyme by top 10 organisations-----------------
+def top_organisations_dates(cleared_data, cube):
+    org_names = cube.launches("Organisation").head(10).index.tolist()
+    filtered_data = cleared_data[cleared_data['Organisation'].isin(org_names)]
+
+    # One bar per organisation, from the first to the last launch
+    dates = filtered_data.groupby("Organisation", observed=True)["Date"].agg(["min", "max"]).reindex(org_names)
+    figure, axes = plt.subplots()
+    axes.bar(dates.index, dates["max"] - dates["min"], bottom=dates["min"])
+    axes.yaxis_date()
+    axes.set_xlabel('Organisation')
+    plt.setp(axes.get_xticklabels(), rotation=45, ha="right")
+    axes.set_ylabel("Dates of launches")
+    axes.set_title("First and last launch of top 10 organisations")
+    return figure
+
+
+# ------------------------Cold war USSR vs USA----------------------------
+def cold_war_pie(cleared_data, cube):
+    # Total number of launches of the USSR and USA
+    return px.pie(_cold_war_cube(cube).rollup("States").reset_index(),
+                  names="States",
+                  values="Launches",
+                  color="States",
+                  hole=0.3,
+                  title="Number of launches per state over years",
+                  labels={"names": 'States',
+                          "values": "Number of launches"
+                          })
+
+
+# ---------Chart that Shows the Total Number of Launches Year-On-Year by the Two Superpowers-----
+def cold_war_launches(cleared_data, cube):
+    launches = _cold_war_cube(cube).rollup(["Year", "States"]).reset_index()
+    return px.bar(launches,
+                  x="Year",
+                  y="Launches",
+                  color="States",
+                  title="Total number of launches year-on-year by the USA and USSR")
+
+
+# -------------------Chart the total number of mission Failures-----------------------
+def cold_war_sunburst(cleared_data, cube):
+    figure = px.sunburst(_cold_war_cube(cube).rollup(["States", "Mission_Status"]).reset_index(),
+                         path=["States", "Mission_Status"],
+                         values="Launches",
+                         branchvalues="total",)
+    figure.update_layout(title="Mission successes and failures by USSR and USA")
+    return figure
+
+
+# ------------Chart the Total Number of Mission Failures Year on Year-----------
+def mission_status_by_date(cleared_data, cube):
+    # Mission_Status_Int: 2 for success, 1 for failure
+    launches = cube.rollup(["Year", "Mission_Status"]).reset_index()
+    launches["Mission_Status_Int"] = np.where(launches["Mission_Status"] == "Success", 2, 1)
+    launches = launches.groupby(["Year", "Mission_Status_Int"])["Launches"].sum().reset_index()
+
+    return px.bar(launches,
+                  x="Year",
+                  y="Launches",
+                  color="Mission_Status_Int",
+                  title="Total number of failures and successes by date")
+
+
+# ----------------Chart the Percentage of Failures over Time---------------------
+def failure_percentage(cleared_data, cube):
+    # Mission_Status is share of successful launches in year
+    percentage = cube.success_rate("Year").rename("Mission_Status").reset_index()
+    percentage["Failure"] = 1 - percentage["Mission_Status"]
+
+    return px.bar(percentage,
+                  x="Year",
+                  y=['Mission_Status', 'Failure'],
+                  labels={'value': 'Percentage', 'variable': 'Mission Status'},
+                  color_discrete_map={"Mission_Status": 'green', 'Failure': 'red'},
+                  barmode='stack',
+                  title="Percentage of successes over years"
+                  )
+
+
+# ---------------Number of launches per year by countries----------------
+def yearly_launches_state(cleared_data, cube):
+    grouped_number_of_launches = cube.rollup(["Year", "States"])["Launches"].reset_index()
+
+    return px.line(grouped_number_of_launches,
+                   x="Year",
+                   y="Launches",
+                   color="States",
+                   markers=True,
+                   title="Number of launches per state over Years",
+                   labels={"Launches": 'Number of Launches',
+                           "Year": "Year"})
+
+
+# ---------------Number of launches per year by organisations----------------
+def yearly_launches_organisation(cleared_data, cube):
+    grouped_org = cube.rollup(["Year", "Organisation"])["Launches"].reset_index()
+
+    return px.line(grouped_org,
+                   x="Year",
+                   y="Launches",
+                   color="Organisation",
+                   markers=True,
+                   labels={"Launches": "Number of Launches",
+                           "Year": "Year"},
+                   title="Number of launches per organisation over years")
+
+
+# All charts in order of the report. Every builder takes cleaned data and LaunchCube.
+# Charts get counts per period or bins, time series are decimated to downsample.MAX_POINTS_PER_TRACE.
+CHARTS = {
+    "price_histogram": price_histogram,
+    "price_per_organisation": price_per_organisation,
+    "launches_per_state": launches_per_state,
+    "fails_per_state": fails_per_state,
+    "state_organisation_sunburst": state_organisation_sunburst,
+    "money_per_organisation": money_per_organisation,
+    "launches_over_years": launches_over_years,
+    "monthly_launches": monthly_launches,
+    "price_over_time": price_over_time,
+    "top_organisations_dates": top_organisations_dates,
+    "cold_war_pie": cold_war_pie,
+    "cold_war_launches": cold_war_launches,
+    "cold_war_sunburst": cold_war_sunburst,
+    "mission_status_by_date": mission_status_by_date,
+    "failure_percentage": failure_percentage,
+    "yearly_launches_state": yearly_launches_state,
+    "yearly_launches_organisation": yearly_launches_organisation,
+}
+
+
+def is_plotly(figure):
+    # Checked by module of the class, so figure of matplotlib does not import plotly
+    return type(figure).__module__.split(".")[0] == "plotly"
+
+
+def show(figure):
+    if is_plotly(figure):
+        figure.show()
+    else:
+        plt.show()
@@ -0,0 +1,150 @@
+import pandas as pd
+
+import profiling
+
+from pandas.api.types import is_numeric_dtype
+from prices import DEFAULT_PRICE_STRATEGY, impute_prices
+from states import resolve_states, resolve_country_codes
+from unique import map_unique
+
+
+# ----------------Delete columns that are just duplicated index-------------------
+def drop_index_columns(frame):
+    index_columns = [name for name in frame.columns if name.startswith("Unnamed: ")]
+    return frame.drop(columns=index_columns)
+
+
+# ----------Changing str to float, missing prices stay NaN, see prices.py---------------------
+def parse_price(prices):
+    if not is_numeric_dtype(prices):
+        prices = prices.str.replace(",", "", regex=False)
+    return pd.to_numeric(prices).astype(float)
+
+
+# -------------Create columns from Detail: Rocket_Name, Rocket_Family, Rocket_Variant and Payload--------------
+# "Falcon 9 Block 5 | Starlink V1 L9 & BlackSky". Rows without "|" have only rocket name.
+# Parts removed from the end of rocket name one after another, what is left is the family:
+ROCKET_VARIANT_PATTERNS = [
+    (r"^(Space Shuttle)\b.*$", r"\1"),      # Orbiter: "Space Shuttle Atlantis"
+    (r"\s*/(?!\w\b).*$", ""),              # Upper stage: "Proton-M/Briz-M", but not "Atlas-E/F Agena D"
+    (r"\s*\(.*$", ""),                      # Configuration: "Cosmos-3M (11K65M)", "Titan IV(401)A"
+    (r"\s+Block\b.*$", ""),                 # "Falcon 9 Block 5"
+    (r"\s+\d{3,4}\S*$", ""),                # Configuration code: "Atlas V 541", "H-IIA 2024", "Delta II 7925-10C"
+    (r"(\s\d+)[A-Z]{1,2}$", r"\1"),         # Letter of model number: "Long March 2D", "Kuaizhou 1A"
+    # Last of three or more words when it has digit or no lower case letter: "Ariane 5 ECA", "Atlas V N22",
+    # but not model number or Roman numeral: "Long March 11", "GSLV Mk III", "Thor-DM 18 Able I"
+    (r"^(\S+\s+\S+.*?)\s+(?!(?:\d+|[IVX]+)$)(?:\S*\d\S*|[^\sa-z]+)$", r"\1"),
+]
+# Payloads of one launch are separated by "&": "Ziyuan-3 03, Apocalypse-10 & NJU-HKU 1" has two.
+# Not before a bare suffix of the previous name, "Longjiang 1 & 2" and "Yaogan 30 J, K & L" are one payload,
+# and not inside a name, "AT&T T-16"
+PAYLOAD_SUFFIX = r"(?:[A-Z]{1,2}|[A-Z]?\d+[A-Z]?)"
+PAYLOAD_SEPARATOR = rf"\s*&\s+(?!{PAYLOAD_SUFFIX}(?:\s*[,&()]|$))"
+# Unnamed payloads at the end: "KX-09 & Others", "SaudiSAT 5A, & 5B and Others", "Cartosat-3 & Rideshares"
+PAYLOAD_PLACEHOLDER = r",?\s*(?:(?:&|\band)\s+)?\b(?:Others|Rideshares)$"
+
+
+def _rocket_families(names):
+    families = pd.Series(names.astype(object))
+    for pattern, replacement in ROCKET_VARIANT_PATTERNS:
+        families = families.str.replace(pattern, replacement, regex=True)
+    variants = [name[len(family):].strip(" /") or None for name, family in zip(names, families)]
+    return pd.DataFrame({"Rocket_Family": families.to_numpy(), "Rocket_Variant": variants}, dtype=object)
+
+
+def rocket_families(names):
+    """Rocket_Family and Rocket_Variant of rocket names, e.g. "Falcon 9" and "Block 5".
+
+    Variant is the rest of the name after family, NaN when the name is only family.
+    """
+    parsed = map_unique(names, _rocket_families)
+    return parsed["Rocket_Family"].astype(str), parsed["Rocket_Variant"].astype(str)
+
+
+def split_detail(frame):
+    detail = frame["Detail"].str.partition("|")
+    frame = frame.drop(columns="Detail")
+    frame["Rocket_Name"] = detail[0].str.strip()
+    frame["Rocket_Family"], frame["Rocket_Variant"] = rocket_families(frame["Rocket_Name"])
+    payload = detail[2].str.strip()
+    frame["Payload"] = payload.where((detail[1] == "|") & (payload != ""))
+    return frame
+
+
+def payload_table(frame):
+    """One row per payload of every launch: Launch (index of the launch in frame) and dictionary encoded Payload."""
+    payloads = frame["Payload"].str.replace(PAYLOAD_PLACEHOLDER, "", regex=True)
+    payloads = payloads.str.split(PAYLOAD_SEPARATOR, regex=True).explode().str.strip(" ,")
+    payloads = payloads[payloads.notna() & (payloads != "")]
+    return pd.DataFrame({"Launch": payloads.index.to_numpy(), "Payload": pd.Categorical(payloads.to_numpy())})
+
+
+# ----------Convert string to datetime object--------
+# "Fri Aug 07, 2020 05:12 UTC", older launches are without time: "Fri Aug 07, 1970"
+DATE_FORMATS = ["%a %b %d, %Y %H:%M UTC", "%a %b %d, %Y"]
+
+
+def _parse_unique_dates(values):
+    parsed = pd.Series(pd.NaT, index=values, dtype="datetime64[ns]")
+    for date_format in DATE_FORMATS:
+        todo = parsed.isna().to_numpy()
+        parsed[todo] = pd.to_datetime(values[todo], format=date_format, errors="coerce")
+    return parsed.to_numpy()
+
+
+def parse_dates(dates):
+    # Dates are in UTC. Strings in unknown format are NaT, count them with unparsed_dates.
+    return map_unique(dates, _parse_unique_dates, dtype="datetime64[ns]")
+
+
+def unparsed_dates(dates):
+    dates = pd.Series(dates)
+    return int((parse_dates(dates).isna() & dates.notna()).sum())
+
+
+def add_year_month(frame):
+    # int64 as after compact.expand, dt.year is int32 in new pandas. Float when some dates are NaT
+    for name, values in [("Year", frame["Date"].dt.year), ("Month", frame["Date"].dt.month)]:
+        frame[name] = values.astype("int64") if values.notna().all() else values
+    return frame
+
+
+# Success = 2, any failure = 1
+def mission_status_int(statuses):
+    return (statuses == "Success").astype("int64") + 1
+
+
+# ---------------Cleaning of raw data: index columns and prices---------------
+def clean(frame):
+    frame = drop_index_columns(frame)
+    with profiling.stage("parse_price", rows=len(frame)):
+        frame["Price"] = parse_price(frame["Price"])
+    return frame
+
+
+# ---------------New columns: states, country codes, rocket/payload, dates---------------
+def enrich(frame):
+    # Rows without known state are dropped, check them with states.unmapped_locations
+    with profiling.stage("resolve_states", rows=len(frame)):
+        frame = frame.assign(States=resolve_states(frame["Location"], errors="ignore"))
+        frame = frame[frame["States"].notna()].reset_index(drop=True)
+    with profiling.stage("resolve_country_codes", rows=len(frame)):
+        frame["Country_Codes"] = resolve_country_codes(frame["States"])
+
+    with profiling.stage("split_detail", rows=len(frame)):
+        frame = split_detail(frame)
+    with profiling.stage("parse_dates", rows=len(frame)):
+        frame["Date"] = parse_dates(frame["Date"])
+        frame = add_year_month(frame)
+    frame["Mission_Status_Int"] = mission_status_int(frame["Mission_Status"])
+    return frame
+
+
+# ---------------All cleaning steps together, result is saved to cache---------------
+def clean_launches(frame, price_strategy=DEFAULT_PRICE_STRATEGY):
+    # price_strategy=None keeps missing prices NaN, e.g. for partitions imputed together later
+    frame = enrich(clean(frame))
+    if price_strategy is None:
+        return frame
+    with profiling.stage("impute_prices", rows=len(frame)):
+        return impute_prices(frame, price_strategy)
@@ -0,0 +1,43 @@
+import pandas as pd
+
+# Columns with few unique values, dictionary encoded as category
+CATEGORY_COLUMNS = ["Organisation", "Location", "States", "Country_Codes", "Rocket_Status", "Mission_Status",
+                    "Rocket_Name", "Rocket_Family", "Rocket_Variant", "Payload", "Price_Source"]
+
+# Small integer columns, only used when column has no NaN
+# Status columns are not stored as bool: a category of two values has int8 codes, one byte per row as bool,
+# and keeps the values, so rows still compare to "StatusActive" or group by Mission_Status in compact frames.
+# Mission_Status_Int keeps 2 for success and 1 for failure, which charts and main.py show.
+INTEGER_COLUMNS = {"Mission_Status_Int": "int8", "Month": "int8", "Year": "int16"}
+
+
+def compact(frame):
+    """Copy of cleaned DataFrame with category and small integer dtypes.
+
+    groupby and value_counts on category columns work with integer codes instead of strings.
+    """
+    # Column with more unique values than half of rows, e.g. Payload, is smaller as str
+    dtypes = {name: "category" for name in CATEGORY_COLUMNS
+              if name in frame.columns and not isinstance(frame[name].dtype, pd.CategoricalDtype)
+              and frame[name].nunique() <= len(frame) / 2}
+    dtypes.update({name: dtype for name, dtype in INTEGER_COLUMNS.items()
+                   if name in frame.columns and frame[name].notna().all()})
+    return frame.astype(dtypes)
+
+
+def memory_report(before, after):
+    # Memory of every column in bytes, strings are counted too
+    report = pd.DataFrame({"Before": before.memory_usage(deep=True, index=False),
+                           "After": after.memory_usage(deep=True, index=False)})
+    report.loc["Total"] = report.sum()
+    report["Ratio"] = report["Before"] / report["After"]
+    return report
+
+
+def expand(frame):
+    # Back to plain str and int64 columns, as after cleaning.clean_launches
+    dtypes = {name: frame[name].cat.categories.dtype for name in frame.columns
+              if isinstance(frame[name].dtype, pd.CategoricalDtype)}
+    dtypes.update({name: "int64" for name, dtype in INTEGER_COLUMNS.items()
+                   if name in frame.columns and frame[name].dtype == dtype})
+    return frame.astype(dtypes)
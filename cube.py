@@ -0,0 +1,110 @@
+import pandas as pd
+
+from states import country_code
+
+# Every chart and table in main.py is grouped by some of these columns
+CUBE_KEYS = ["Year", "Month", "States", "Organisation", "Mission_Status"]
+
+
+def _plain_level(values):
+    # Category keys are grouped by codes, cube index has their values so cubes of any frames can be merged
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.astype(values.categories.dtype)
+    return values
+
+
+def _build_table(frame):
+    table = (frame.assign(Launches=1)
+                  .groupby(CUBE_KEYS, observed=True, dropna=False)
+                  .agg(Launches=("Launches", "sum"), Price_Sum=("Price", "sum")))
+    table.index = pd.MultiIndex.from_arrays([_plain_level(table.index.get_level_values(key)) for key in CUBE_KEYS])
+    return table.sort_index()
+
+
+class LaunchCube:
+    """Number of launches and sum of prices per Year x Month x State x Organisation x Mission_Status.
+
+    Rows of the cleaned DataFrame are scanned once, every table and chart is a roll-up of the cube.
+    """
+
+    def __init__(self, table=None):
+        if table is None:
+            index = pd.MultiIndex.from_tuples([], names=CUBE_KEYS)
+            table = pd.DataFrame({"Launches": pd.Series(dtype="int64"),
+                                  "Price_Sum": pd.Series(dtype=float)}, index=index)
+        self.table = table
+        self._geo = None
+
+    @classmethod
+    def from_frame(cls, frame):
+        return cls(_build_table(frame))
+
+    def update(self, frame):
+        # New launch rows are added to the cube, old rows are not scanned again
+        if len(frame):
+            self.merge(LaunchCube.from_frame(frame))
+        return self
+
+    def merge(self, other):
+        # Cube of other rows is added to this one, e.g. cubes of partitions cleaned in parallel
+        if len(other.table):
+            table = self.table.add(other.table, fill_value=0)
+            table["Launches"] = table["Launches"].astype("int64")
+            self.table = table.sort_index()
+            self._geo = None
+        return self
+
+    def select(self, **conditions):
+        # Value is list of allowed values or slice for ranges, e.g. Year=slice(None, 1991)
+        mask = pd.Series(True, index=self.table.index)
+        for key, allowed in conditions.items():
+            values = self.table.index.get_level_values(key)
+            if isinstance(allowed, slice):
+                if allowed.start is not None:
+                    mask &= values >= allowed.start
+                if allowed.stop is not None:
+                    mask &= values <= allowed.stop
+            else:
+                mask &= values.isin(list(allowed))
+        return LaunchCube(self.table[mask.to_numpy()])
+
+    def rollup(self, keys):
+        # Launches and Price_Sum summed over all other keys
+        if isinstance(keys, str):
+            keys = [keys]
+        return self.table.groupby(level=keys, observed=True).sum()
+
+    def launches(self, key):
+        return self.rollup(key)["Launches"].sort_values(ascending=False, kind="stable")
+
+    def successes(self, key, success=True):
+        status = self.table.index.get_level_values("Mission_Status") == "Success"
+        cube = LaunchCube(self.table[status if success else ~status])
+        return cube.launches(key)
+
+    def success_rate(self, key):
+        rolled = self.rollup(key)["Launches"]
+        return (self.successes(key).reindex(rolled.index, fill_value=0) / rolled).rename("Success_Rate")
+
+    def price_sum(self, key):
+        return self.rollup(key)["Price_Sum"]
+
+    def price_mean(self, key):
+        rolled = self.rollup(key)
+        return (rolled["Price_Sum"] / rolled["Launches"]).rename("Price")
+
+    def geo(self):
+        """State, Launches, Failures, Success_Rate and Price_Sum per state indexed by ISO 3166 alpha-3 Code.
+
+        Computed once per cube, choropleths and service.py use the same table.
+        """
+        # Cubes pickled by older code have no _geo
+        if getattr(self, "_geo", None) is None:
+            rolled = self.rollup("States")
+            failures = self.successes("States", success=False).reindex(rolled.index, fill_value=0)
+            geo = pd.DataFrame({"State": rolled.index.to_numpy(), "Launches": rolled["Launches"].to_numpy(),
+                                "Failures": failures.to_numpy(), "Price_Sum": rolled["Price_Sum"].to_numpy()},
+                               index=pd.Index([country_code(state) for state in rolled.index], name="Code"))
+            geo.insert(3, "Success_Rate", 1 - geo["Failures"] / geo["Launches"])
+            self._geo = geo.sort_index()
+        return self._geo
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+# Upper limit of points in one chart trace, figure size stays bounded for any number of launches
+MAX_POINTS_PER_TRACE = 1000
+
+
+def lttb(x, y, threshold):
+    """Indexes of points kept by Largest-Triangle-Three-Buckets decimation.
+
+    x must be sorted. First and last point are always kept.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    length = len(x)
+    if threshold >= length or threshold < 3:
+        return np.arange(length)
+
+    # Points between first and last are split to threshold - 2 buckets
+    edges = np.linspace(1, length - 1, threshold - 1).astype(int)
+    kept = np.empty(threshold, dtype=int)
+    kept[0] = 0
+    kept[-1] = length - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # Average of next bucket is the third point of triangle, last bucket uses the last point
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_end = length - 1, length
+        average_x = x[next_start:next_end].mean()
+        average_y = y[next_start:next_end].mean()
+
+        area = np.abs((x[previous] - average_x) * (y[start:end] - y[previous])
+                      - (x[previous] - x[start:end]) * (average_y - y[previous]))
+        previous = start + int(area.argmax())
+        kept[bucket + 1] = previous
+    return kept
+
+
+def decimate(frame, x, y, color=None, max_points=None):
+    # Every trace (group of color column) keeps at most max_points rows
+    max_points = max_points or MAX_POINTS_PER_TRACE
+    frame = frame.sort_values(x, kind="stable")
+    groups = [frame] if color is None else [group for _, group in frame.groupby(color, observed=True, sort=False)]
+
+    parts = []
+    for group in groups:
+        if len(group) <= max_points:
+            parts.append(group)
+            continue
+        x_values = group[x]
+        if pd.api.types.is_datetime64_any_dtype(x_values):
+            x_values = x_values.astype("int64")
+        parts.append(group.iloc[lttb(x_values, group[y], max_points)])
+    return pd.concat(parts) if parts else frame
+
+
+def binned(values, bins):
+    # Histogram counts and bin edges, chart gets bins instead of every value
+    values = pd.Series(values).dropna()
+    return np.histogram(values, bins=bins)
@@ -0,0 +1,146 @@
+import argparse
+import json
+import os
+
+import pandas as pd
+
+from cleaning import clean_launches
+from cube import LaunchCube
+from parts import active_retired, part_paths, read_part, update_rockets, write_part
+from pipeline import DATA_PATH, Pipeline
+from prices import DEFAULT_PRICE_STRATEGY, PRICE_STRATEGIES, PriceImputer
+from reliability import RELIABILITY_KEYS, RollingReliability
+from states import resolve_states, unmapped_locations
+
+STORE_DIR = ".store"
+
+
+class LaunchStore:
+    """Cleaned launches and their aggregates in a directory, new launches are appended.
+
+    Every append writes only new rows and updates LaunchCube and rocket names,
+    so it takes time proportional to the new rows, not to the history. Launches older than ones in the store
+    are appended too, only reliability is built again from all rows then.
+    Missing prices of new rows are filled with price statistics of the history the store was created from.
+    """
+
+    def __init__(self, directory=STORE_DIR):
+        self.directory = directory
+        self.cube = pd.read_pickle(self._path("cube.pickle"))
+        self.imputer = pd.read_pickle(self._path("imputer.pickle"))
+        # RollingReliability per key of reliability.RELIABILITY_KEYS
+        self.reliability = pd.read_pickle(self._path("reliability.pickle"))
+        with open(self._path("rockets.json")) as file:
+            self.rockets = {status: set(names) for status, names in json.load(file).items()}
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    @classmethod
+    def create(cls, cleared_data, directory=STORE_DIR, price_strategy=DEFAULT_PRICE_STRATEGY):
+        # New store from cleaned history, old store in directory is replaced
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.startswith("part-"):
+                os.remove(os.path.join(directory, name))
+        pd.to_pickle(LaunchCube(), os.path.join(directory, "cube.pickle"))
+        pd.to_pickle(PriceImputer(price_strategy).fit(cleared_data), os.path.join(directory, "imputer.pickle"))
+        pd.to_pickle({name: RollingReliability(column) for name, column in RELIABILITY_KEYS.items()},
+                     os.path.join(directory, "reliability.pickle"))
+        with open(os.path.join(directory, "rockets.json"), "w") as file:
+            json.dump({}, file)
+
+        store = cls(directory)
+        store.append_cleaned(cleared_data)
+        return store
+
+    @classmethod
+    def exists(cls, directory=STORE_DIR):
+        return os.path.exists(os.path.join(directory, "cube.pickle"))
+
+    def parts(self):
+        return part_paths(self.directory)
+
+    def append(self, delta, errors="raise"):
+        """Clean new raw launches (DataFrame or path of csv) and add them to the store.
+
+        Locations without state raise UnmappedLocationError before anything is written,
+        errors="ignore" drops their rows, see states.unmapped_locations.
+        Returns the cleaned new rows.
+        """
+        if isinstance(delta, str):
+            delta = pd.read_csv(delta)
+        resolve_states(delta["Location"], errors=errors)
+        cleaned = self.imputer.transform(clean_launches(delta, price_strategy=None))
+        return self.append_cleaned(cleaned)
+
+    def append_cleaned(self, cleaned):
+        if not len(cleaned):
+            return cleaned
+        # Reliability first, it reads the parts before the new one is written
+        self._update_reliability(cleaned)
+        write_part(cleaned, self._path(f"part-{len(self.parts()):06d}"))
+
+        self.cube.update(cleaned)
+        update_rockets(self.rockets, cleaned)
+
+        pd.to_pickle(self.cube, self._path("cube.pickle"))
+        pd.to_pickle(self.reliability, self._path("reliability.pickle"))
+        with open(self._path("rockets.json"), "w") as file:
+            json.dump({status: sorted(names) for status, names in self.rockets.items()}, file)
+        return cleaned
+
+    def _update_reliability(self, cleaned):
+        # Late or backfilled launches, older than ones in the store, rebuild the trackers from all parts
+        if all(tracker.accepts(cleaned) for tracker in self.reliability.values()):
+            for tracker in self.reliability.values():
+                tracker.update(cleaned)
+            return
+        columns = list(dict.fromkeys([tracker.key for tracker in self.reliability.values()]
+                                     + ["Date", "Mission_Status"]))
+        history = pd.concat([self.load(columns), cleaned[columns]], ignore_index=True)
+        trackers = {name: RollingReliability(tracker.key, tracker.last, tracker.window)
+                    for name, tracker in self.reliability.items()}
+        for tracker in trackers.values():
+            tracker.update(history)
+        self.reliability = trackers
+
+    def load(self, columns=None):
+        # Whole cleaned history, the only operation reading all rows
+        frames = [read_part(path, columns) for path in self.parts()]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+
+    def active_retired_rockets(self):
+        return active_retired(self.rockets)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Append new launches to cleaned data and aggregates")
+    parser.add_argument("delta", help="csv with new launches, in the schema of data/mission_launches.csv")
+    parser.add_argument("--store", default=STORE_DIR)
+    parser.add_argument("--data", default=DATA_PATH, help="history used when the store does not exist yet")
+    parser.add_argument("--skip-unmapped", action="store_true",
+                        help="drop launches whose location has no known state instead of failing")
+    parser.add_argument("--price-strategy", choices=sorted(PRICE_STRATEGIES), default=DEFAULT_PRICE_STRATEGY,
+                        help="how missing prices are filled, used when the store does not exist yet")
+    args = parser.parse_args()
+
+    if not LaunchStore.exists(args.store):
+        cleared_data = Pipeline(args.data, price_strategy=args.price_strategy).get("cleared_data")
+        LaunchStore.create(cleared_data, args.store, args.price_strategy)
+    store = LaunchStore(args.store)
+    delta = pd.read_csv(args.delta)
+    new_rows = store.append(delta, errors="ignore" if args.skip_unmapped else "raise")
+
+    cube = store.cube
+    print(f"Appended launches: {len(new_rows)}\n")
+    missing_locations = unmapped_locations(delta["Location"])
+    if missing_locations:
+        print(f"Locations without state, rows dropped: \n{missing_locations}\n")
+    print(f"Number of launches per organisation: \n{cube.launches('Organisation')}\n")
+    print(f"Number of launches per state: \n{cube.launches('States')}\n")
+    print(f"Successes per organisation: \n{cube.successes('Organisation')}\n")
+    print(f"Failures per organisation: \n{cube.successes('Organisation', success=False)}\n")
+    print(f"Average price per organisation: \n{cube.price_mean('Organisation')}\n")
+    print(f"Number of active and retired rockets: \n{store.active_retired_rockets()}\n")
+    print(f"Reliability per organisation: \n{store.reliability['organisation'].summary()}\n")
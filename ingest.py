@@ -0,0 +1,107 @@
+import argparse
+
+import pandas as pd
+
+from cleaning import clean_launches
+from prices import DEFAULT_PRICE_STRATEGY, PRICE_STRATEGIES, PriceImputer
+
+DATA_PATH = "data/mission_launches.csv"
+CHUNKSIZE = 100_000
+
+# Low cardinality columns, stored as category to cut per-row memory
+CATEGORICAL_DTYPES = {
+    "Organisation": "category",
+    "Rocket_Status": "category",
+    "Mission_Status": "category",
+}
+
+
+def read_chunks(path=DATA_PATH, chunksize=CHUNKSIZE, dtype=None):
+    # Price stays str, thousands are written as "5,000.0"
+    dtype = {"Price": str, **(dtype or {})}
+    return pd.read_csv(path, chunksize=chunksize, dtype=dtype)
+
+
+def fit_prices(path=DATA_PATH, chunksize=CHUNKSIZE, dtype=None, price_strategy=DEFAULT_PRICE_STRATEGY):
+    # First pass over the file, price statistics of all rows do not depend on chunksize.
+    # Chunks are merged into counts per distinct price, see PriceImputer.partial_fit
+    imputer = PriceImputer(price_strategy)
+    for chunk in read_chunks(path, chunksize, dtype):
+        imputer.partial_fit(clean_launches(chunk, price_strategy=None)[imputer.columns()])
+    return imputer
+
+
+def clean_chunk(chunk, imputer):
+    # The same cleaning steps as main.py, rows without known state are dropped.
+    # Missing prices are filled by imputer fitted on the whole file, see fit_prices
+    return imputer.transform(clean_launches(chunk, price_strategy=None))
+
+
+def _counts(values):
+    # value_counts of categorical column lists also categories that are not in chunk
+    counts = values.value_counts(sort=False)
+    counts = counts[counts > 0]
+    counts.index = counts.index.astype(object)
+    return counts
+
+
+class LaunchAggregates:
+    """Launch counts and success counts per organisation, state and year, merged chunk by chunk."""
+
+    KEYS = ["Organisation", "States", "Year"]
+
+    def __init__(self):
+        self.rows = 0
+        self.dropped_rows = 0
+        self.price_sum = pd.Series(dtype=float)
+        self.launches = {key: pd.Series(dtype="int64") for key in self.KEYS}
+        self.successes = {key: pd.Series(dtype="int64") for key in self.KEYS}
+
+    def update(self, chunk, raw_rows=None):
+        self.rows += len(chunk)
+        if raw_rows is not None:
+            self.dropped_rows += raw_rows - len(chunk)
+        success = chunk[chunk["Mission_Status"] == "Success"]
+        for key in self.KEYS:
+            self.launches[key] = self.launches[key].add(_counts(chunk[key]), fill_value=0).astype("int64")
+            self.successes[key] = self.successes[key].add(_counts(success[key]), fill_value=0).astype("int64")
+        price = chunk.groupby("Organisation", observed=True)["Price"].sum()
+        price.index = price.index.astype(object)
+        self.price_sum = self.price_sum.add(price, fill_value=0)
+        return self
+
+    def launches_per(self, key):
+        return self.launches[key].sort_values(ascending=False, kind="stable")
+
+    def success_rate(self, key):
+        successes = self.successes[key].reindex(self.launches[key].index, fill_value=0)
+        return (successes / self.launches[key]).sort_index()
+
+
+def aggregate_csv(path=DATA_PATH, chunksize=CHUNKSIZE, dtype=None, price_strategy=DEFAULT_PRICE_STRATEGY):
+    # Only one chunk is in memory at a time, the aggregates are small. The file is read twice, see fit_prices
+    imputer = fit_prices(path, chunksize, dtype, price_strategy)
+    aggregates = LaunchAggregates()
+    for chunk in read_chunks(path, chunksize, dtype):
+        raw_rows = len(chunk)
+        aggregates.update(clean_chunk(chunk, imputer), raw_rows)
+    return aggregates
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chunked ingestion of mission launches")
+    parser.add_argument("path", nargs="?", default=DATA_PATH)
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE)
+    parser.add_argument("--categorical", action="store_true",
+                        help="read Organisation, Rocket_Status and Mission_Status as categories")
+    parser.add_argument("--price-strategy", choices=sorted(PRICE_STRATEGIES), default=DEFAULT_PRICE_STRATEGY)
+    args = parser.parse_args()
+
+    result = aggregate_csv(args.path, args.chunksize, CATEGORICAL_DTYPES if args.categorical else None,
+                           args.price_strategy)
+    print(f"Rows: {result.rows}, dropped rows without state: {result.dropped_rows}\n")
+    print(f"Number of launches per organisation: \n{result.launches_per('Organisation')}\n")
+    print(f"Number of launches per state: \n{result.launches_per('States')}\n")
+    print(f"Number of launches per year: \n{result.launches['Year'].sort_index()}\n")
+    print(f"Success rate per organisation: \n{result.success_rate('Organisation')}\n")
+    print(f"Success rate per year: \n{result.success_rate('Year')}\n")
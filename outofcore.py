@@ -0,0 +1,134 @@
+import argparse
+import os
+
+import pandas as pd
+
+from cleaning import clean_launches
+from cube import LaunchCube
+from ingest import read_chunks
+from parts import active_retired, part_paths, read_part, update_rockets, write_part
+from pipeline import AGGREGATES, DATA_PATH, Pipeline, active_retired_rockets
+from prices import DEFAULT_PRICE_STRATEGY, PRICE_STRATEGIES, PriceImputer
+
+PARTS_DIR = ".parts"
+# Memory for one partition, raw chunk and all copies made while it is cleaned
+MEMORY_BUDGET = 256 * 2 ** 20
+# Cleaning keeps about this many copies of a raw chunk in memory at once
+CLEANING_COPIES = 6
+SAMPLE_ROWS = 1000
+
+
+def chunk_rows(source, memory_budget=MEMORY_BUDGET):
+    # Rows of csv that fit in the budget, measured on first rows of the file
+    sample = pd.read_csv(source, nrows=SAMPLE_ROWS, dtype={"Price": str})
+    row_bytes = sample.memory_usage(deep=True, index=False).sum() / max(len(sample), 1)
+    return max(int(memory_budget / (row_bytes * CLEANING_COPIES)), 1)
+
+
+class PartitionedLaunches:
+    """Cleaned launches in partition files, only one partition is in memory at a time.
+
+    PartitionedLaunches.from_csv runs the same cleaning as cleaning.clean_launches, the cube and
+    rocket names are collected partition by partition, so every aggregation of pipeline.AGGREGATES
+    is computed without the whole DataFrame.
+    """
+
+    def __init__(self, directory=PARTS_DIR):
+        self.directory = directory
+        self.cube = LaunchCube()
+        self.rockets = {}
+        self.rows = 0
+
+    def parts(self):
+        return part_paths(self.directory)
+
+    def frames(self, columns=None):
+        for path in self.parts():
+            yield read_part(path, columns)
+
+    @classmethod
+    def from_csv(cls, source=DATA_PATH, directory=PARTS_DIR, memory_budget=MEMORY_BUDGET,
+                 price_strategy=DEFAULT_PRICE_STRATEGY):
+        launches = cls(directory)
+        os.makedirs(directory, exist_ok=True)
+        for path in launches.parts():
+            os.remove(path)
+
+        # 1. Rows are cleaned chunk by chunk, every step except imputation of prices works on one row
+        for number, chunk in enumerate(read_chunks(source, chunk_rows(source, memory_budget))):
+            cleaned = clean_launches(chunk, price_strategy=None)
+            write_part(cleaned, os.path.join(directory, f"part-{number:06d}"))
+
+        # 2. Price statistics need all rows, they are merged partition by partition as in ingest.fit_prices,
+        # only columns used by the strategy are read
+        imputer = PriceImputer(price_strategy)
+        for frame in launches.frames(imputer.columns()):
+            imputer.partial_fit(frame)
+
+        # 3. Prices are filled and aggregates updated partition by partition
+        for path in launches.parts():
+            cleaned = imputer.transform(read_part(path))
+            os.remove(path)
+            write_part(cleaned, os.path.splitext(path)[0])
+            launches.add(cleaned)
+        return launches
+
+    def add(self, cleaned):
+        self.rows += len(cleaned)
+        self.cube.update(cleaned)
+        update_rockets(self.rockets, cleaned)
+        return self
+
+    def active_retired_rockets(self):
+        return active_retired(self.rockets)
+
+    def aggregates(self):
+        # The same tables as pipeline.AGGREGATES over cleaned data in memory
+        results = {name: func(self.cube) for name, func in AGGREGATES.items()}
+        results["active_retired_rockets"] = self.active_retired_rockets()
+        return results
+
+
+def compare_with_pandas(launches, source=DATA_PATH, price_strategy=DEFAULT_PRICE_STRATEGY):
+    # Names of aggregates different from the in-memory pipeline, empty list when all match
+    pipeline = Pipeline(source, use_cache=False, price_strategy=price_strategy)
+    expected = {name: pipeline.get(name) for name in AGGREGATES}
+    expected["active_retired_rockets"] = active_retired_rockets(pipeline.get("cleared_data"))
+    different = []
+    for name, result in launches.aggregates().items():
+        check = pd.testing.assert_frame_equal if isinstance(result, pd.DataFrame) else pd.testing.assert_series_equal
+        try:
+            check(result, expected[name], check_exact=True)
+        except AssertionError:
+            different.append(name)
+    return different
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aggregations of launches csv larger than memory")
+    parser.add_argument("source", nargs="?", default=DATA_PATH)
+    parser.add_argument("--parts", default=PARTS_DIR, help="directory for cleaned partition files")
+    parser.add_argument("--memory-budget", type=int, default=MEMORY_BUDGET // 2 ** 20,
+                        help="memory for one partition in MB")
+    parser.add_argument("--price-strategy", choices=sorted(PRICE_STRATEGIES), default=DEFAULT_PRICE_STRATEGY)
+    parser.add_argument("--check", action="store_true",
+                        help="compare results with in-memory pipeline, the csv has to fit in memory")
+    args = parser.parse_args()
+
+    launches = PartitionedLaunches.from_csv(args.source, args.parts, args.memory_budget * 2 ** 20,
+                                            args.price_strategy)
+    results = launches.aggregates()
+    print(f"Cleaned launches: {launches.rows} in {len(launches.parts())} partitions\n")
+    print(f"Number of launches per organisation: \n{results['launches_per_organisation']}\n")
+    print(f"Number of launches per state: \n{results['launches_per_state']}\n")
+    print(f"Successes per organisation: \n{results['successes_per_organisation']}\n")
+    print(f"Failures per organisation: \n{results['failures_per_organisation']}\n")
+    print(f"Success rate per year: \n{results['success_rate_per_year']}\n")
+    print(f"Sum of prices per organisation: \n{results['price_sum_per_organisation']}\n")
+    print(f"Number of active and retired rockets: \n{results['active_retired_rockets']}\n")
+
+    if args.check:
+        different = compare_with_pandas(launches, args.source, args.price_strategy)
+        print(f"Different from in-memory pandas: {different}" if different else "Same as in-memory pandas")
+        if different:
+            raise SystemExit(1)
@@ -0,0 +1,44 @@
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+from cleaning import clean_launches
+from cube import LaunchCube
+from prices import DEFAULT_PRICE_STRATEGY, impute_prices
+
+# Partitions do not depend on number of workers, so the merged result is the same for any worker count
+PARTITION_ROWS = 100_000
+
+
+def partitions(frame, rows=PARTITION_ROWS):
+    return [frame.iloc[start:start + rows] for start in range(0, len(frame), rows)]
+
+
+def _map(func, parts, workers):
+    # workers=1 runs in this process, results are in order of partitions in both cases
+    if workers == 1 or len(parts) <= 1:
+        return [func(part) for part in parts]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, parts))
+
+
+def clean_parallel(raw, workers=None, partition_rows=PARTITION_ROWS, price_strategy=DEFAULT_PRICE_STRATEGY):
+    """Clean raw launches in process pool, returns cleaned DataFrame and LaunchCube.
+
+    Cleaned rows are the same as cleaning.clean_launches(raw). Medians of prices need all rows,
+    so prices are imputed and the cube is built after partitions are merged.
+    """
+    cleared_data = clean_frame_parallel(raw, workers, partition_rows)
+    if price_strategy is not None:
+        cleared_data = impute_prices(cleared_data, price_strategy)
+    return cleared_data, LaunchCube.from_frame(cleared_data)
+
+
+def clean_frame_parallel(raw, workers=None, partition_rows=PARTITION_ROWS):
+    # Cleaned and enriched rows, missing prices stay NaN
+    clean = partial(clean_launches, price_strategy=None)
+    frames = _map(clean, partitions(raw, partition_rows), workers or os.cpu_count())
+    return pd.concat(frames, ignore_index=True) if frames else clean(raw)
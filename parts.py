@@ -0,0 +1,41 @@
+import os
+
+import pandas as pd
+
+from cache import feather
+from compact import compact, expand
+
+
+# ---------------Cleaned launches in partition files, used by incremental.py and outofcore.py---------------
+def part_paths(directory):
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.startswith("part-"))
+
+
+def write_part(frame, path):
+    # Feather of compact frame when pyarrow is installed, pickle without it. path is without extension
+    if feather is not None:
+        feather.write_feather(compact(frame).reset_index(drop=True), path + ".feather", compression="uncompressed")
+    else:
+        frame.to_pickle(path + ".pickle")
+
+
+def read_part(path, columns=None):
+    # Only the given columns are read from feather
+    if path.endswith(".feather"):
+        return expand(feather.read_table(path, columns=columns, memory_map=True).to_pandas())
+    frame = pd.read_pickle(path)
+    return frame if columns is None else frame[columns]
+
+
+# ---------------Rocket names per Rocket_Status, collected part by part---------------
+def update_rockets(rockets, cleaned):
+    for status, names in cleaned.groupby("Rocket_Status", observed=True)["Rocket_Name"]:
+        rockets.setdefault(status, set()).update(names.dropna())
+    return rockets
+
+
+def active_retired(rockets):
+    # The same as pipeline.active_retired_rockets of all collected rows
+    active = rockets.get("StatusActive", set())
+    retired = set().union(*[names for status, names in rockets.items() if status != "StatusActive"])
+    return pd.Series({"Active": len(active), "Retired": len(retired)})
@@ -0,0 +1,170 @@
+from functools import partial
+
+import pandas as pd
+
+import profiling
+
+from cache import CACHE_DIR, load_cached, save_cache
+from charts import CHARTS
+from cleaning import clean, enrich, payload_table
+from compact import compact
+from cube import LaunchCube
+from parallel import clean_frame_parallel
+from prices import DEFAULT_PRICE_STRATEGY, impute_prices
+from query import LaunchIndex
+from reliability import RELIABILITY_KEYS, latest_reliability
+
+DATA_PATH = "data/mission_launches.csv"
+
+
+class Stage:
+    """One step of the analysis. func is called with outputs of the input stages."""
+
+    def __init__(self, name, func, inputs=(), output=None, persist=False):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.output = output or name
+        self.persist = persist          # Output is saved to and loaded from cache.py
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, inputs={self.inputs}, output={self.output!r})"
+
+
+# ---------------------------Aggregations of the cube and cleaned data---------------------------
+def active_retired_rockets(cleared_data):
+    active = cleared_data["Rocket_Status"] == "StatusActive"
+    return pd.Series({"Active": cleared_data.loc[active, "Rocket_Name"].nunique(),
+                      "Retired": cleared_data.loc[~active, "Rocket_Name"].nunique()})
+
+
+AGGREGATES = {
+    "launches_per_organisation": lambda cube: cube.launches("Organisation"),
+    "launches_per_state": lambda cube: cube.launches("States"),
+    "successes_per_organisation": lambda cube: cube.successes("Organisation"),
+    "failures_per_organisation": lambda cube: cube.successes("Organisation", success=False),
+    "price_mean_per_organisation": lambda cube: cube.price_mean("Organisation"),
+    "price_sum_per_organisation": lambda cube: cube.price_sum("Organisation"),
+    "success_rate_per_year": lambda cube: cube.success_rate("Year"),
+    "launches_per_year_state": lambda cube: cube.rollup(["Year", "States"])["Launches"],
+    "launches_per_year_organisation": lambda cube: cube.rollup(["Year", "Organisation"])["Launches"],
+    "geo": lambda cube: cube.geo(),
+}
+
+
+def default_stages(source=DATA_PATH, jobs=None, price_strategy=DEFAULT_PRICE_STRATEGY):
+    stages = [Stage("load", partial(pd.read_csv, source), output="raw")]
+    if jobs:
+        # Cleaning and enrichment together, in jobs processes
+        stages.append(Stage("clean_parallel", partial(clean_frame_parallel, workers=jobs), ["raw"],
+                            output="enriched"))
+    else:
+        stages += [Stage("clean", clean, ["raw"], output="clean"),
+                   Stage("enrich", enrich, ["clean"], output="enriched")]
+    stages += [
+        # Medians of prices need all rows, so prices are imputed after partitions are merged
+        Stage("impute_prices", partial(impute_prices, strategy=price_strategy), ["enriched"],
+              output="cleared_data", persist=True),
+        Stage("aggregate", LaunchCube.from_frame, ["cleared_data"], output="cube"),
+        Stage("active_retired_rockets", active_retired_rockets, ["cleared_data"]),
+        Stage("index", LaunchIndex, ["cleared_data"]),
+        Stage("payloads", payload_table, ["cleared_data"]),
+    ]
+    stages += [Stage(name, func, ["cube"]) for name, func in AGGREGATES.items()]
+    # Success rate of the last launches and of the last 365 days at the last launch of every key
+    stages += [Stage(f"reliability_per_{name}", partial(latest_reliability, key=column), ["cleared_data"])
+               for name, column in RELIABILITY_KEYS.items()]
+    # Render stages, output is figure of charts.CHARTS
+    stages += [Stage(f"render_{name}", build, ["cleared_data", "cube"], output=f"chart:{name}")
+               for name, build in CHARTS.items()]
+    return stages
+
+
+class Pipeline:
+    """Lazy, memoized analysis of one launches csv.
+
+    Every output is computed on first get() with only the stages it depends on, e.g.
+    Pipeline().get("launches_per_organisation") with valid cache does not read the csv at all.
+    """
+
+    def __init__(self, source=DATA_PATH, stages=None, use_cache=True, cache_dir=CACHE_DIR, jobs=None,
+                 compact=False, price_strategy=DEFAULT_PRICE_STRATEGY):
+        self.source = source
+        self.compact = compact          # Cleaned data with category and small integer dtypes
+        self.cache_params = {"price_strategy": price_strategy}
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self.stages = {}
+        self.results = {}
+        for stage in stages if stages is not None else default_stages(source, jobs, price_strategy):
+            self.add(stage)
+
+    def add(self, stage):
+        self.stages[stage.output] = stage
+        self.invalidate(stage.output)
+        return stage
+
+    def _stage(self, output):
+        try:
+            return self.stages[output]
+        except KeyError:
+            raise KeyError(f"No stage has output {output!r}. Outputs: {sorted(self.stages)}") from None
+
+    def _load_persisted(self, stage):
+        if stage.persist and self.use_cache:
+            with profiling.stage(f"load_cache:{stage.output}"):
+                return load_cached(self.source, self.cache_dir, self.compact, self.cache_params)
+        return None
+
+    def get(self, output):
+        if output in self.results:
+            return self.results[output]
+
+        stage = self._stage(output)
+        result = self._load_persisted(stage)
+        if result is None:
+            inputs = [self.get(name) for name in stage.inputs]
+            # Inputs are measured as their own stages
+            with profiling.stage(stage.name) as record:
+                result = stage.func(*inputs)
+            if record is not None:
+                record["rows"] = len(result) if hasattr(result, "__len__") else None
+            if stage.persist and self.use_cache:
+                with profiling.stage(f"save_cache:{stage.output}", rows=len(result)):
+                    save_cache(result, self.source, self.cache_dir, self.cache_params)
+            if stage.persist and self.compact:
+                result = compact(result)
+        self.results[output] = result
+        return result
+
+    def is_cached(self, output):
+        # True when output is computed or can be loaded from cache without running its inputs
+        if output in self.results:
+            return True
+        stage = self._stage(output)
+        if stage.persist and self.use_cache:
+            result = self._load_persisted(stage)
+            if result is not None:
+                self.results[output] = result
+                return True
+        return False
+
+    def plan(self, output):
+        # Names of stages that get(output) would run, in order
+        if self.is_cached(output):
+            return []
+        stage = self._stage(output)
+        names = []
+        for name in stage.inputs:
+            names += [step for step in self.plan(name) if step not in names]
+        return names + [stage.name]
+
+    def invalidate(self, output=None):
+        # Forget output and everything computed from it, None forgets everything
+        if output is None:
+            self.results.clear()
+            return
+        self.results.pop(output, None)
+        for stage in self.stages.values():
+            if output in stage.inputs:
+                self.invalidate(stage.output)
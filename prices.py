@@ -0,0 +1,163 @@
+import numpy as np
+import pandas as pd
+
+# Price of last resort, used only when no step of the strategy knows better
+DEFAULT_PRICE = 16.5
+
+# Column whose median price fills missing prices of the group
+GROUP_COLUMNS = {"organisation": "Organisation", "state": "States", "rocket": "Rocket_Name"}
+
+# Strategy -> steps tried in order, every step fills only prices the previous steps could not.
+# E.g. organisations without any known price get median price of their state.
+PRICE_STRATEGIES = {
+    "organisation": ["organisation", "state", "constant"],
+    "state": ["state", "constant"],
+    "rocket": ["rocket", "organisation", "state", "constant"],
+    "interpolate": ["interpolate", "state", "constant"],
+    "constant": ["constant"],
+}
+DEFAULT_PRICE_STRATEGY = "organisation"
+
+# Groups with fewer known prices are skipped, the next step fills them. E.g. RVSN USSR has only
+# two prices, both of Energiya, its median would price every Soviet launch like Energiya
+MIN_PRICES = 5
+
+# Price_Source of prices that were in the data
+REPORTED = "reported"
+
+
+def _merge(total, new):
+    # Statistics of one more chunk added to the ones before
+    if total is None:
+        return new
+    return total.add(new, fill_value=0).astype("int64" if isinstance(new, pd.Series) else {"count": "int64"})
+
+
+def _medians(counts, min_count):
+    # Median of every group from numbers of launches per (group, price), the middle of sorted prices
+    counts = counts.sort_index()
+    groups = counts.index.get_level_values(0)
+    prices = counts.index.get_level_values(1).to_numpy(float)
+    after = counts.groupby(level=0, sort=False).cumsum().to_numpy()
+    before = after - counts.to_numpy()
+    total = counts.groupby(level=0, sort=False).transform("sum").to_numpy()
+    middle = []
+    for position in [(total - 1) // 2, total // 2]:
+        # Every group has exactly one price covering the position
+        at = (before <= position) & (position < after)
+        middle.append(pd.Series(prices[at], index=groups[at]))
+    medians = (middle[0] + middle[1]) / 2
+    return medians[total[after == total] >= min_count].rename_axis(None).astype(float)
+
+
+def _interpolation_points(points, min_count):
+    # Organisation -> (dates as int64, mean prices), launches of one organisation on the same date are averaged,
+    # np.interp needs unique dates
+    known = {}
+    for organisation, group in points.sort_index().groupby(level=0, sort=False):
+        if group["count"].sum() >= min_count:
+            dates = group.index.get_level_values(1).to_numpy("datetime64[ns]").astype(np.int64)
+            known[organisation] = dates, (group["sum"] / group["count"]).to_numpy()
+    return known
+
+
+class PriceImputer:
+    """Fills missing prices with the steps of strategy, see PRICE_STRATEGIES.
+
+    Group medians and known prices over time are computed once by fit, transform only looks them up.
+    So the imputer fitted on history fills new launches too. "interpolate" is linear in time between
+    known prices of the same organisation, before the first and after the last one the nearest price is used.
+    Groups and organisations with fewer than min_count known prices are left to the next step.
+    """
+
+    def __init__(self, strategy=DEFAULT_PRICE_STRATEGY, constant=DEFAULT_PRICE, min_count=MIN_PRICES):
+        if strategy not in PRICE_STRATEGIES:
+            raise ValueError(f"Unknown price strategy {strategy!r}, choose from {sorted(PRICE_STRATEGIES)}")
+        self.strategy = strategy
+        self.steps = PRICE_STRATEGIES[strategy]
+        self.constant = constant
+        self.min_count = min_count
+        self.counts = {}        # Step -> number of launches per (group, price)
+        self.points = None      # Sum and count of prices per (Organisation, Date)
+        self.medians = {step: pd.Series(dtype=float) for step in self.steps if step in GROUP_COLUMNS}
+        self.known = {}         # Organisation -> (dates as int64, prices), sorted by date
+
+    def columns(self):
+        # Columns used by fit, other columns of cleaned launches are not needed for price statistics
+        columns = [GROUP_COLUMNS[step] for step in self.steps if step in GROUP_COLUMNS]
+        if "interpolate" in self.steps:
+            columns += ["Organisation", "Date"]
+        return list(dict.fromkeys(columns + ["Price"]))
+
+    def fit(self, frame):
+        self.counts, self.points = {}, None
+        return self.partial_fit(frame)
+
+    def partial_fit(self, frame):
+        """Add price statistics of frame to the ones fitted before, e.g. of earlier chunks of a file.
+
+        Only numbers of launches per distinct price are kept, not rows, so medians stay exact
+        and memory grows with groups and distinct prices, not with the file.
+        """
+        # Prices filled before, e.g. in cleaned history, are not used
+        known = frame["Price"].notna()
+        if "Price_Source" in frame.columns:
+            known &= frame["Price_Source"] == REPORTED
+        known = frame[known]
+        for step in self.steps:
+            if step in GROUP_COLUMNS:
+                column = GROUP_COLUMNS[step]
+                counts = known.groupby([known[column].astype(object), "Price"]).size()
+                self.counts[step] = _merge(self.counts.get(step), counts)
+                self.medians[step] = _medians(self.counts[step], self.min_count)
+
+        if "interpolate" in self.steps:
+            dated = known[known["Date"].notna()]
+            points = dated.groupby([dated["Organisation"].astype(object), "Date"])["Price"].agg(["sum", "count"])
+            self.points = _merge(self.points, points)
+            self.known = _interpolation_points(self.points, self.min_count)
+        return self
+
+    def _fill(self, step, rows):
+        # Prices of rows by one step, NaN where the step does not know the price
+        if step == "constant":
+            return np.full(len(rows), self.constant)
+        if step in GROUP_COLUMNS:
+            return self.medians[step].reindex(rows[GROUP_COLUMNS[step]].to_numpy(object)).to_numpy(float)
+
+        values = np.full(len(rows), np.nan)
+        dated = np.flatnonzero(rows["Date"].notna().to_numpy())
+        dates = rows["Date"].to_numpy("datetime64[ns]").astype(np.int64)
+        for organisation, positions in rows.iloc[dated].groupby("Organisation", observed=True).indices.items():
+            if organisation in self.known:
+                positions = dated[positions]
+                values[positions] = np.interp(dates[positions], *self.known[organisation])
+        return values
+
+    def transform(self, frame):
+        """Copy of frame with missing prices filled and column Price_Source, the step that gave the price."""
+        prices = frame["Price"].to_numpy(float, copy=True)
+        source = np.full(len(frame), REPORTED, dtype=object)
+        for step in self.steps:
+            missing = np.flatnonzero(np.isnan(prices))
+            if not len(missing):
+                break
+            values = self._fill(step, frame.iloc[missing])
+            found = ~np.isnan(values)
+            prices[missing[found]] = values[found]
+            source[missing[found]] = step
+        return frame.assign(Price=prices, Price_Source=pd.Series(source, index=frame.index, dtype=str))
+
+    def fit_transform(self, frame):
+        return self.fit(frame).transform(frame)
+
+
+def impute_prices(frame, strategy=DEFAULT_PRICE_STRATEGY):
+    # Statistics are computed from the frame itself
+    return PriceImputer(strategy).fit_transform(frame)
+
+
+def price_fills(frame):
+    # Number of prices filled by every step, prices in the data are not counted
+    source = frame["Price_Source"]
+    return source[source != REPORTED].value_counts()
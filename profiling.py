@@ -0,0 +1,146 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+from contextlib import nullcontext
+
+import pandas as pd
+
+# LAUNCHES_PROFILE=profile.json python main.py turns profiling on and writes Chrome trace to the file
+ENV_VAR = "LAUNCHES_PROFILE"
+# LAUNCHES_PROFILE_MEMORY=0 measures only times, tracemalloc slows allocations down
+MEMORY_ENV_VAR = "LAUNCHES_PROFILE_MEMORY"
+
+# Profiler of this process, None when profiling is off
+_active = None
+_DISABLED = nullcontext()
+
+
+class _Span:
+    """Context manager measuring one run of stage, the record is filled on exit."""
+
+    def __init__(self, profiler, name, rows):
+        self.profiler = profiler
+        self.record = {"name": name, "rows": rows}
+        self.peak = 0
+
+    def __enter__(self):
+        profiler = self.profiler
+        if profiler.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # Peak of the outer stage is saved before it is reset for this one
+            if profiler.stack:
+                profiler.stack[-1].peak = max(profiler.stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            self.start_memory = current
+        profiler.stack.append(self)
+        self.start_cpu = time.process_time()
+        self.start = time.perf_counter()
+        return self.record
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter()
+        end_cpu = time.process_time()
+        profiler = self.profiler
+        profiler.stack.pop()
+        self.record.update(start=self.start - profiler.start, wall=end - self.start, cpu=end_cpu - self.start_cpu,
+                           depth=len(profiler.stack))
+        if profiler.memory:
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            self.record["peak_memory"] = self.peak - self.start_memory
+            if profiler.stack:
+                profiler.stack[-1].peak = max(profiler.stack[-1].peak, self.peak)
+            tracemalloc.reset_peak()
+        profiler.records.append(self.record)
+        return False
+
+
+class Profiler:
+    """Wall time, CPU time, peak memory and rows of named stages.
+
+    with profiler.stage("parse_dates", rows=len(frame)) as record:
+        ...
+        record["rows"] = len(result)       # optional, rows of the result
+
+    Peak memory is the most Python memory allocated during the stage above the memory at its start.
+    """
+
+    def __init__(self, memory=True):
+        self.memory = memory
+        self.records = []
+        self.stack = []
+        self.start = time.perf_counter()
+        # tracemalloc started by someone else, e.g. benchmark.py, is not stopped by disable()
+        self.started_tracing = memory and not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start()
+
+    def stage(self, name, rows=None):
+        return _Span(self, name, rows)
+
+    def summary(self):
+        # One row per stage name, stages run more times are summed
+        columns = ["name", "rows", "wall", "cpu", "peak_memory"]
+        frame = pd.DataFrame(self.records, columns=columns + ["start", "depth"])
+        table = frame.groupby("name", sort=False).agg(
+            calls=("name", "size"), wall_s=("wall", "sum"), cpu_s=("cpu", "sum"),
+            peak_memory_mb=("peak_memory", "max"), rows=("rows", "max"))
+        table["peak_memory_mb"] /= 2 ** 20
+        table["rows"] = table["rows"].astype("Int64")
+        return table.sort_values("wall_s", ascending=False)
+
+    def chrome_trace(self):
+        # Complete events of chrome://tracing and https://ui.perfetto.dev, times in microseconds
+        pid, tid = os.getpid(), threading.get_ident()
+        events = []
+        for record in self.records:
+            args = {"cpu_ms": record["cpu"] * 1000, "rows": record["rows"]}
+            if "peak_memory" in record:
+                args["peak_memory_mb"] = record["peak_memory"] / 2 ** 20
+            events.append({"name": record["name"], "cat": "stage", "ph": "X", "pid": pid, "tid": tid,
+                           "ts": record["start"] * 1e6, "dur": record["wall"] * 1e6, "args": args})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path):
+        with open(path, "w") as file:
+            json.dump(self.chrome_trace(), file)
+
+
+# ---------------------------Profiler of the process, used by pipeline and cleaning---------------------------
+def enable(memory=True):
+    global _active
+    _active = Profiler(memory)
+    return _active
+
+
+def enable_from_env():
+    # Profiler when ENV_VAR is set, otherwise None
+    if not os.environ.get(ENV_VAR):
+        return None
+    return enable(memory=os.environ.get(MEMORY_ENV_VAR, "1") != "0")
+
+
+def disable():
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None and profiler.started_tracing:
+        tracemalloc.stop()
+    return profiler
+
+
+def active():
+    return _active
+
+
+def stage(name, rows=None):
+    # Measures the stage when profiling is on, otherwise only one check of global variable
+    if _active is None:
+        return _DISABLED
+    return _active.stage(name, rows)
+
+
+def trace_path(default="profile.json"):
+    value = os.environ.get(ENV_VAR)
+    return default if value in (None, "", "1") else value
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+
+# Query argument -> indexed column
+INDEXED_COLUMNS = {
+    "organisation": "Organisation",
+    "state": "States",
+    "rocket": "Rocket_Name",
+    "family": "Rocket_Family",
+    "status": "Mission_Status",
+    "location": "Location",
+}
+
+
+def _as_list(values):
+    return [values] if isinstance(values, str) else list(values)
+
+
+def _end_bound(end):
+    # Searchsorted value and side of the end of date range. Date without time, e.g. "2020-08-07",
+    # includes the whole day, so the bound is the next midnight and launches at it are excluded
+    timestamp = pd.Timestamp(end)
+    if timestamp != timestamp.normalize() or (isinstance(end, str) and ":" in end):
+        return timestamp, "right"
+    return timestamp + pd.Timedelta(days=1), "left"
+
+
+class LaunchIndex:
+    """Cleaned launches sorted by date with position lists per Organisation, State, Rocket_Name,
+    Rocket_Family, Mission_Status and Location.
+
+    index.query(organisation="CASC", success=False, years=(1990, 2005), location="Jiuquan")
+    touches only positions of matching rows.
+    """
+
+    def __init__(self, cleared_data):
+        order = np.argsort(cleared_data["Date"].to_numpy(), kind="stable")      # NaT is last
+        self.data = cleared_data.take(order).reset_index(drop=True)
+        self.dates = self.data["Date"].to_numpy()
+        # Positions in every list are sorted, so they are sorted by date too
+        self.positions = {column: {key: positions.astype(np.int64) for key, positions in
+                                   self.data.groupby(column, observed=True, sort=False).indices.items()}
+                          for column in INDEXED_COLUMNS.values()}
+
+    def __len__(self):
+        return len(self.data)
+
+    def _key_positions(self, argument, values):
+        lists = self.positions[INDEXED_COLUMNS[argument]]
+        values = _as_list(values)
+        if argument == "location":
+            # Part of location name is enough, e.g. "Jiuquan", case is ignored
+            parts = [value.lower() for value in values]
+            keys = [key for key in lists if any(part in key.lower() for part in parts)]
+        else:
+            keys = [key for key in values if key in lists]
+
+        found = [lists[key] for key in keys]
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        return found[0] if len(found) == 1 else np.sort(np.concatenate(found))
+
+    def _date_bounds(self, start, end, years):
+        # Slice of self.data in date range, launches without date are only in the unfiltered one
+        if start is None and end is None and years is None:
+            return 0, len(self.dates)
+        end, side = (None, "left") if end is None else _end_bound(end)
+        if years is not None:
+            first, last = years
+            start = start if first is None else pd.Timestamp(year=first, month=1, day=1)
+            end, side = (end, side) if last is None else (pd.Timestamp(year=last + 1, month=1, day=1), "left")
+        low = 0 if start is None else np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start)), "left")
+        if end is None:
+            high = np.searchsorted(self.dates, np.datetime64("NaT"), "left")
+        else:
+            high = np.searchsorted(self.dates, np.datetime64(end), side)
+        return int(low), int(high)
+
+    def positions_of(self, organisation=None, state=None, rocket=None, family=None, status=None, location=None,
+                     success=None, start=None, end=None, years=None):
+        """Sorted positions in self.data of launches matching all given filters.
+
+        Every key filter takes one value or list of values. success=False selects every kind of failure,
+        start/end are dates including both ends, end without time includes its whole day, and years=(1990, 2005) includes whole years.
+        """
+        filters = {"organisation": organisation, "state": state, "rocket": rocket, "family": family,
+                   "status": status, "location": location}
+        if success is not None:
+            statuses = self.positions["Mission_Status"]
+            failures = [key for key in statuses if key != "Success"]
+            filters["success"] = ["Success"] if success else failures
+
+        low, high = self._date_bounds(start, end, years)
+        lists = []
+        for argument, values in filters.items():
+            if values is not None:
+                positions = self._key_positions("status" if argument == "success" else argument, values)
+                # Lists are sorted by date, date range is a slice of every list
+                lists.append(positions[np.searchsorted(positions, low):np.searchsorted(positions, high)])
+        if not lists:
+            return np.arange(low, high)
+
+        # The shortest list first, every intersection is at most as long as it
+        lists.sort(key=len)
+        positions = lists[0]
+        for other in lists[1:]:
+            positions = np.intersect1d(positions, other, assume_unique=True)
+        return positions
+
+    def query(self, **filters):
+        return self.data.take(self.positions_of(**filters))
+
+    def count(self, **filters):
+        return len(self.positions_of(**filters))
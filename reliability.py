@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+
+# Success rate over the last launches and over trailing time window, both include the launch itself
+LAST_LAUNCHES = 20
+WINDOW = pd.Timedelta(days=365)
+
+# Name used in pipeline outputs -> column
+RELIABILITY_KEYS = {"organisation": "Organisation", "family": "Rocket_Family"}
+
+COLUMNS = ["Launches", "Successes", "Success_Rate", "Recent_Launches", "Recent_Successes", "Recent_Success_Rate",
+           "Window_Launches", "Window_Successes", "Window_Success_Rate"]
+
+
+def _rolling(codes, seconds, success, last, window):
+    """Reliability columns of launches sorted by group code and date.
+
+    Every window is a difference of two positions of one cumulative sum, so all groups and
+    windows are computed together without loop over groups.
+    """
+    position = np.arange(len(codes))
+    new_group = np.r_[True, codes[1:] != codes[:-1]]
+    group_start = np.maximum.accumulate(np.where(new_group, position, 0))
+    cumulative = np.r_[0, np.cumsum(success)]
+
+    # Dates of every group are moved behind the previous group, further than window,
+    # so one searchsorted finds the first launch of window in all groups
+    span = seconds.max() - seconds.min() + window + 1 if len(seconds) else 0
+    axis = (np.cumsum(new_group) - 1) * span + (seconds - (seconds.min() if len(seconds) else 0))
+    window_start = np.searchsorted(axis, axis - window, side="right")
+    recent_start = np.maximum(position - last + 1, group_start)
+
+    columns = {}
+    for name, start in [("", group_start), ("Recent_", recent_start), ("Window_", window_start)]:
+        launches = position - start + 1
+        successes = cumulative[position + 1] - cumulative[start]
+        columns[f"{name}Launches"] = launches
+        columns[f"{name}Successes"] = successes
+    return columns
+
+
+class RollingReliability:
+    """Success rate per key (e.g. Organisation) over the last launches, trailing window and all history.
+
+    Launches are added in batches with update, only launches still inside some window are kept,
+    so every update takes time proportional to the new launches. Launches of a key must come
+    in order of dates, launches without date or key are skipped.
+    """
+
+    def __init__(self, key="Organisation", last=LAST_LAUNCHES, window=WINDOW):
+        self.key = key
+        self.last = last
+        self.window = pd.Timedelta(window)
+        self.tail = pd.DataFrame({key: pd.Series(dtype=object), "Date": pd.Series(dtype="datetime64[ns]"),
+                                  "Success": pd.Series(dtype="int64")})
+        # Launches and successes per key that are not in tail any more
+        self.base = pd.DataFrame({"Launches": pd.Series(dtype="int64"), "Successes": pd.Series(dtype="int64")})
+        self.latest = None            # Reliability at the last launch of every key
+
+    def accepts(self, cleaned):
+        # False when launches of some key are older than its last launch added before, update would raise
+        if self.latest is None:
+            return True
+        new = cleaned[cleaned[self.key].notna() & cleaned["Date"].notna()]
+        last = self.latest["Date"].reindex(new[self.key].astype(object).to_numpy()).to_numpy("datetime64[ns]")
+        return not (new["Date"].to_numpy("datetime64[ns]") < last).any()
+
+    def update(self, cleaned):
+        """Add cleaned launches, returns their reliability columns, sorted by key and date.
+
+        Raises ValueError when accepts(cleaned) is False, nothing is changed then.
+        """
+        if not self.accepts(cleaned):
+            raise ValueError("Launches are older than launches added before, build RollingReliability again")
+        new = cleaned[cleaned[self.key].notna() & cleaned["Date"].notna()]
+        new_codes, keys = pd.factorize(new[self.key])
+        keys = pd.Index(np.asarray(keys, dtype=object))
+        keys = keys.append(pd.Index(self.tail[self.key].unique(), dtype=object).difference(keys))
+
+        # Kept launches first, so with the same date they stay before the new ones
+        codes = np.concatenate([keys.get_indexer(self.tail[self.key]), new_codes])
+        dates = np.concatenate([self.tail["Date"].to_numpy("datetime64[ns]"), new["Date"].to_numpy("datetime64[ns]")])
+        success = np.concatenate([self.tail["Success"].to_numpy(),
+                                  (new["Mission_Status"] == "Success").to_numpy("int64")])
+        is_new = np.arange(len(codes)) >= len(self.tail)
+        index = self.tail.index.append(new.index)
+        seconds = dates.astype("datetime64[s]").astype(np.int64)
+
+        order = np.lexsort((seconds, codes))
+        codes, dates, seconds, success, is_new, index = (codes[order], dates[order], seconds[order], success[order],
+                                                         is_new[order], index[order])
+        window = int(self.window.total_seconds())
+        columns = _rolling(codes, seconds, success, self.last, window)
+        base = self.base.reindex(keys, fill_value=0)
+        columns["Launches"] += base["Launches"].to_numpy()[codes]
+        columns["Successes"] += base["Successes"].to_numpy()[codes]
+
+        table = pd.DataFrame({self.key: pd.Categorical.from_codes(codes, keys), "Date": dates, **columns},
+                             index=index)
+        for name in ["", "Recent_", "Window_"]:
+            table[f"{name}Success_Rate"] = table[f"{name}Successes"] / table[f"{name}Launches"]
+        table = table[[self.key, "Date"] + COLUMNS]
+
+        # Last launch of every key, position of it for every launch
+        group_end = np.flatnonzero(np.append(codes[1:] != codes[:-1], len(codes) > 0))
+        own_end = group_end[np.searchsorted(group_end, np.arange(len(codes)))]
+        self._update_latest(table.iloc[group_end[is_new[group_end]]])
+        self._trim(codes, keys, dates, seconds, success, index, own_end, window)
+        return table[is_new]
+
+    def _update_latest(self, rows):
+        latest = rows.set_index(rows[self.key].astype(object).rename(self.key))[COLUMNS + ["Date"]]
+        if self.latest is not None:
+            latest = pd.concat([self.latest[~self.latest.index.isin(latest.index)], latest])
+        # concat of object indexes of strings gives str index
+        self.latest = latest.set_axis(latest.index.astype(object)).sort_index()
+
+    def _trim(self, codes, keys, dates, seconds, success, index, own_end, window):
+        # Kept are the last launches and launches in window before the last date of every key
+        keep = (own_end - np.arange(len(codes)) < self.last) | (seconds > seconds[own_end] - window)
+        dropped = pd.DataFrame({"Launches": np.bincount(codes[~keep], minlength=len(keys)),
+                                "Successes": np.bincount(codes[~keep], success[~keep], len(keys)).astype("int64")},
+                               index=keys)
+        self.base = self.base.add(dropped, fill_value=0).astype("int64")
+        self.tail = pd.DataFrame({self.key: keys[codes[keep]], "Date": dates[keep], "Success": success[keep]},
+                                 index=index[keep])
+
+    def summary(self):
+        # Reliability of every key at its last launch, the most reliable first
+        if self.latest is None:
+            return pd.DataFrame(columns=COLUMNS + ["Date"])
+        return self.latest.sort_values(["Recent_Success_Rate", "Launches"], ascending=False, kind="stable")
+
+
+def rolling_reliability(cleared_data, key="Organisation", last=LAST_LAUNCHES, window=WINDOW):
+    # Reliability columns for every launch, indexed by rows of cleared_data
+    return RollingReliability(key, last, window).update(cleared_data)
+
+
+def latest_reliability(cleared_data, key="Organisation", last=LAST_LAUNCHES, window=WINDOW):
+    tracker = RollingReliability(key, last, window)
+    tracker.update(cleared_data)
+    return tracker.summary()
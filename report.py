@@ -0,0 +1,101 @@
+import base64
+import io
+import json
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import matplotlib.pyplot as plt
+
+from plotly.offline import get_plotlyjs
+
+import downsample
+
+from charts import CHARTS, is_plotly
+
+REPORT_DIR = "report"
+
+# Data for charts, set once in every worker process
+_worker_data = {}
+
+
+def _init_worker(cleared_data, cube, max_points):
+    # Workers have no display, matplotlib must not open windows
+    matplotlib.use("Agg")
+    downsample.MAX_POINTS_PER_TRACE = max_points
+    _worker_data["cleared_data"] = cleared_data
+    _worker_data["cube"] = cube
+
+
+def _png(figure):
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png", bbox_inches="tight")
+    return buffer.getvalue()
+
+
+def render_chart(name, output_dir):
+    """Build one chart, write it to output_dir and return its html fragment with timings.
+
+    Plotly charts are written as html, matplotlib charts as png.
+    """
+    start = time.perf_counter()
+    figure = CHARTS[name](_worker_data["cleared_data"], _worker_data["cube"])
+    built = time.perf_counter()
+
+    if is_plotly(figure):
+        figure.write_html(os.path.join(output_dir, f"{name}.html"), include_plotlyjs="cdn")
+        fragment = figure.to_html(full_html=False, include_plotlyjs=False)
+    else:
+        png = _png(figure)
+        plt.close(figure)
+        with open(os.path.join(output_dir, f"{name}.png"), "wb") as file:
+            file.write(png)
+        fragment = f'<img src="data:image/png;base64,{base64.b64encode(png).decode()}">'
+    written = time.perf_counter()
+
+    return name, fragment, {"build": built - start, "write": written - built, "total": written - start}
+
+
+def _report_html(fragments):
+    # plotly.js is included once, the report works without internet
+    sections = "\n".join(f'<section id="{name}"><h2>{name}</h2>\n{fragment}\n</section>'
+                         for name, fragment in fragments)
+    return ("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n<title>Space missions analysis</title>\n"
+            f"<script type=\"text/javascript\">{get_plotlyjs()}</script>\n</head>\n<body>\n"
+            f"<h1>Space missions analysis</h1>\n{sections}\n</body>\n</html>\n")
+
+
+def export_report(cleared_data, cube, output_dir=REPORT_DIR, names=None, workers=None, max_points=None):
+    """Render charts in process pool, write every chart, report.html and timings.json to output_dir.
+
+    Returns timings of every chart in seconds.
+    """
+    names = list(CHARTS) if names is None else list(names)
+    os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cleared_data, cube,
+                                       max_points or downsample.MAX_POINTS_PER_TRACE)) as pool:
+        results = list(pool.map(render_chart, names, [output_dir] * len(names)))
+
+    fragments = [(name, fragment) for name, fragment, _ in results]
+    with open(os.path.join(output_dir, "report.html"), "w", encoding="utf-8") as file:
+        file.write(_report_html(fragments))
+
+    timings = {name: timing for name, _, timing in results}
+    timings["report_total"] = {"total": time.perf_counter() - start}
+    with open(os.path.join(output_dir, "timings.json"), "w") as file:
+        json.dump(timings, file, indent=2)
+    return timings
+
+
+def print_timings(timings):
+    print(f"{'Chart':<32}{'build [s]':>12}{'write [s]':>12}{'total [s]':>12}")
+    charts = sorted((item for item in timings.items() if item[0] != "report_total"),
+                    key=lambda item: item[1]["total"], reverse=True)
+    for name, timing in charts:
+        print(f"{name:<32}{timing['build']:>12.3f}{timing['write']:>12.3f}{timing['total']:>12.3f}")
+    print(f"{'Report total':<32}{'':>24}{timings['report_total']['total']:>12.3f}")
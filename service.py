@@ -0,0 +1,260 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from charts import COLD_WAR_LAST_YEAR, COLD_WAR_STATES
+from cube import LaunchCube
+from pipeline import DATA_PATH, Pipeline
+
+HOST = "127.0.0.1"
+PORT = 8050
+CACHE_SIZE = 256
+# Source csv is checked for changes at most once per this many seconds
+CHECK_INTERVAL = 1.0
+
+
+# ---------------------------Analyses, every one takes LaunchCube---------------------------
+def _value(value):
+    # numpy numbers are not JSON serializable, NaN is null
+    if value != value:
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+
+def _series(series):
+    return {str(key): _value(value) for key, value in series.items()}
+
+
+def launches_per_organisation(cube):
+    return _series(cube.launches("Organisation"))
+
+
+def states_map(cube):
+    # Choropleth data, one row per state keyed by ISO-3 code
+    geo = cube.geo().reset_index()
+    return [{name.lower(): _value(value) for name, value in row.items()} for row in geo.to_dict("records")]
+
+
+def success_rate_per_year(cube):
+    return _series(cube.success_rate("Year"))
+
+
+def cold_war(cube):
+    cold_war_cube = cube.select(States=COLD_WAR_STATES, Year=slice(None, COLD_WAR_LAST_YEAR))
+    per_year = cold_war_cube.rollup(["Year", "States"])["Launches"].unstack(fill_value=0)
+    return {"launches": _series(cold_war_cube.launches("States")),
+            "success_rate": _series(cold_war_cube.success_rate("States")),
+            "launches_per_year": {state: _series(per_year[state]) for state in per_year.columns}}
+
+
+def price_per_organisation(cube):
+    return {"mean": _series(cube.price_mean("Organisation")), "sum": _series(cube.price_sum("Organisation"))}
+
+
+ENDPOINTS = {
+    "/launches/organisation": launches_per_organisation,
+    "/launches/state": states_map,
+    "/success-rate/year": success_rate_per_year,
+    "/cold-war": cold_war,
+    "/price/organisation": price_per_organisation,
+}
+
+
+def parse_filters(params):
+    """Query parameters -> LaunchIndex filters.
+
+    organisation, state, rocket, family, status and location take comma separated values,
+    success is true/false, start/end are dates and from_year/to_year whole years.
+    Wrong values raise ValueError.
+    """
+    filters = {}
+    for name in ["organisation", "state", "rocket", "family", "status", "location"]:
+        if name in params:
+            filters[name] = params[name][0].split(",")
+    if "success" in params:
+        filters["success"] = params["success"][0].lower() in ["1", "true", "yes"]
+    for name in ["start", "end"]:
+        if name in params:
+            # Wrong date is error of the request, not of the service. The string is passed on,
+            # LaunchIndex tells "2020-08-07" (whole day) from "2020-08-07 00:00"
+            if pd.Timestamp(params[name][0]) is pd.NaT:
+                raise ValueError(f"{name} is not a date: {params[name][0]!r}")
+            filters[name] = params[name][0]
+    if "from_year" in params or "to_year" in params:
+        filters["years"] = tuple(int(params[name][0]) if name in params else None
+                                 for name in ["from_year", "to_year"])
+    return filters
+
+
+class ResultCache:
+    """LRU cache of results. Requests for result that is being computed wait for it instead of computing again."""
+
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key, compute):
+        if key in self.results:
+            self.hits += 1
+            self.results.move_to_end(key)
+            return await asyncio.shield(self.results[key])
+
+        self.misses += 1
+        future = asyncio.ensure_future(compute())
+        self.results[key] = future
+        if len(self.results) > self.size:
+            self.results.popitem(last=False)
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            self.results.pop(key, None)      # Errors are not cached
+            raise
+
+    def clear(self):
+        self.results.clear()
+
+
+class AnalyticsService:
+    def __init__(self, source=DATA_PATH, cache_size=CACHE_SIZE):
+        self.source = source
+        self.cache = ResultCache(cache_size)
+        self.latency = {}            # path -> [requests, total seconds, max seconds]
+        # (version of source, Pipeline), replaced in one step, so a request never mixes two versions
+        self.loaded = self._load(self._source_version())
+        self.reloading = None
+        self.checked = 0.0
+
+    def _source_version(self):
+        stat = os.stat(self.source)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _load(self, version):
+        # Cleaned data is loaded once, from cache when it is valid
+        pipeline = Pipeline(self.source)
+        pipeline.get("cube")
+        pipeline.get("index")
+        return version, pipeline
+
+    def check_data(self):
+        # Changed source is loaded in thread, requests get the old version until it is ready
+        now = time.monotonic()
+        if now - self.checked < CHECK_INTERVAL or self.reloading is not None:
+            return
+        self.checked = now
+        version = self._source_version()
+        if version != self.loaded[0]:
+            self.reloading = asyncio.get_running_loop().run_in_executor(None, self._load, version)
+            self.reloading.add_done_callback(self._loaded)
+
+    def _loaded(self, future):
+        self.reloading = None
+        if future.cancelled() or future.exception() is not None:
+            return                   # Old version is served, the next check tries again
+        self.loaded = future.result()
+        self.cache.clear()
+
+    def _compute(self, pipeline, path, filters):
+        cube = pipeline.get("cube")
+        if filters:
+            cube = LaunchCube.from_frame(pipeline.get("index").query(**filters))
+        return ENDPOINTS[path](cube)
+
+    async def handle(self, path, params):
+        if path == "/metrics":
+            return 200, self.metrics()
+        if path not in ENDPOINTS:
+            return 404, {"error": f"Unknown endpoint {path}", "endpoints": sorted(ENDPOINTS) + ["/metrics"]}
+        try:
+            filters = parse_filters(params)
+        except ValueError as error:
+            return 400, {"error": str(error)}
+
+        self.check_data()
+        version, pipeline = self.loaded
+        key = (version, path, json.dumps(filters, sort_keys=True, default=str))
+        loop = asyncio.get_running_loop()
+        # pandas work runs in thread, event loop keeps accepting requests
+        result = await self.cache.get(key, lambda: loop.run_in_executor(None, self._compute, pipeline, path,
+                                                                        filters))
+        return 200, result
+
+    def record(self, path, seconds):
+        # Only known endpoints, other paths would add a row to metrics per request
+        if path not in ENDPOINTS and path != "/metrics":
+            return
+        stats = self.latency.setdefault(path, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2], seconds)
+
+    def metrics(self):
+        lookups = self.cache.hits + self.cache.misses
+        return {
+            "cache": {"hits": self.cache.hits, "misses": self.cache.misses, "size": len(self.cache.results),
+                      "hit_rate": self.cache.hits / lookups if lookups else None},
+            "latency": {path: {"requests": count, "mean_ms": total / count * 1000, "max_ms": longest * 1000}
+                        for path, (count, total, longest) in self.latency.items()},
+        }
+
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               500: "Internal Server Error"}
+
+
+async def _respond(writer, status, body):
+    data = json.dumps(body).encode()
+    writer.write(f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode() + data)
+    await writer.drain()
+    writer.close()
+
+
+async def _client(service, reader, writer):
+    start = time.perf_counter()
+    try:
+        request_line = (await reader.readline()).decode("latin-1").split()
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):       # Headers are not used
+            pass
+        if len(request_line) < 2:
+            writer.close()
+            return
+        if request_line[0] != "GET":
+            await _respond(writer, 405, {"error": "Only GET is supported"})
+            return
+
+        url = urlsplit(request_line[1])
+        try:
+            status, body = await service.handle(url.path, parse_qs(url.query))
+        except Exception as error:
+            status, body = 500, {"error": repr(error)}
+        await _respond(writer, status, body)
+        service.record(url.path, time.perf_counter() - start)
+    except ConnectionError:
+        writer.close()
+
+
+async def serve(service, host=HOST, port=PORT):
+    server = await asyncio.start_server(lambda reader, writer: _client(service, reader, writer), host, port)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP JSON service with analyses of space missions")
+    parser.add_argument("--data", default=DATA_PATH)
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE)
+    args = parser.parse_args()
+
+    print(f"Serving {sorted(ENDPOINTS)} and /metrics on http://{args.host}:{args.port}")
+    asyncio.run(serve(AnalyticsService(args.data, args.cache_size), args.host, args.port))
@@ -0,0 +1,77 @@
+import pandas as pd
+
+from functools import lru_cache
+from iso3166 import countries
+from unique import map_unique
+
+# ---------------Location token -> ISO 3166 state name--------------------------
+# Every token of the comma separated Location string is looked up here, first hit wins.
+LOCATION_TO_STATE = {
+    "Kazakhstan": "Russian Federation",
+    "Russia": "Russian Federation",
+    "Barents Sea": "Russian Federation",
+    "USA": "USA",
+    "New Mexico": "USA",
+    "Pacific Missile Range Facility": "USA",
+    "Gran Canaria": "USA",
+    "Pacific Ocean": "USA",
+    "China": "China",
+    "Yellow Sea": "China",
+    "Japan": "Japan",
+    "New Zealand": "New Zealand",
+    "India": "India",
+    "France": "France",
+    "Shahrud Missile Test Site": "Iran, Islamic Republic of",
+    "Iran": "Iran, Islamic Republic of",
+    "Israel": "Israel",
+    "North Korea": "Korea, Democratic People's Republic of",
+    "South Korea": "Korea, Republic of",
+    "Australia": "Australia",
+    "Brazil": "Brazil",
+    "Kenya": "Kenya",
+}
+
+
+class UnmappedLocationError(ValueError):
+    def __init__(self, locations):
+        self.locations = list(locations)
+        super().__init__(f"No state found for locations: {self.locations}")
+
+
+@lru_cache(maxsize=None)
+def state_of_location(location):
+    # The first token is the launch pad itself, the state is always in one of the later ones.
+    for token in location.split(",")[1:]:
+        state = LOCATION_TO_STATE.get(token.strip())
+        if state is not None:
+            return state
+    return None
+
+
+@lru_cache(maxsize=None)
+def country_code(state):
+    # alpha3 code, e.g. "USA", "RUS", "CHN"
+    return countries.get(state).alpha3
+
+
+def resolve_states(locations, errors="raise"):
+    """Map Location strings to state names.
+
+    errors="raise" raises UnmappedLocationError listing every location without a state,
+    errors="ignore" leaves NaN in those rows so the column stays aligned.
+    """
+    locations = pd.Series(locations)
+    states = map_unique(locations, lambda unique: [state_of_location(location) for location in unique])
+    missing = states.isna() & locations.notna()
+    if missing.any() and errors == "raise":
+        raise UnmappedLocationError(locations[missing].unique())
+    return states
+
+
+def unmapped_locations(locations):
+    return sorted(location for location in pd.unique(pd.Series(locations).dropna())
+                  if state_of_location(location) is None)
+
+
+def resolve_country_codes(states):
+    return map_unique(states, lambda unique: [country_code(state) for state in unique])
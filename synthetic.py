@@ -0,0 +1,79 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from states import LOCATION_TO_STATE
+
+COLUMNS = ["Unnamed: 0.1", "Unnamed: 0", "Organisation", "Location", "Date", "Detail", "Rocket_Status", "Price",
+           "Mission_Status"]
+
+ORGANISATIONS = ["RVSN USSR", "Arianespace", "CASC", "General Dynamics", "NASA", "VKS RF", "US Air Force", "ULA",
+                 "Boeing", "Martin Marietta", "SpaceX", "MHI", "Northrop", "Lockheed", "ISRO", "Roscosmos"]
+ROCKETS = ["Falcon 9 Block 5", "Long March 2D", "Soyuz 2.1a", "Atlas V 541", "Ariane 5 ECA", "Proton-M/Briz-M",
+           "H-IIA 202", "PSLV-XL", "Electron/Curie", "Vostok-2M", "Cosmos-3M (11K65M)", "Delta II 7925"]
+PAYLOADS = ["Starlink V1 L9 & BlackSky", "Gaofen-9 04 & Q-SAT", "Perseverance", "Progress MS-15", "Kosmos 1234",
+            "GPS IIR-7", "Meteor-M 2"]
+MISSION_STATUSES = ["Success", "Failure", "Partial Failure", "Prelaunch Failure"]
+MISSION_WEIGHTS = [0.897, 0.078, 0.024, 0.001]
+
+FIRST_LAUNCH = np.datetime64("1957-10-04")
+LAST_LAUNCH = np.datetime64("2020-08-07")
+
+
+def _locations():
+    # "Pad, Launch Center, State" for every state token that states.py knows
+    return [f"LC-{number}, Launch Center {number}, {token}" for number, token in enumerate(LOCATION_TO_STATE)]
+
+
+def generate(rows, seed=0, missing_price=0.78):
+    """Random launches in the schema of data/mission_launches.csv.
+
+    missing_price is share of launches without price, as in the real data.
+    """
+    random = np.random.default_rng(seed)
+    locations = np.array(_locations())
+
+    minutes = (LAST_LAUNCH - FIRST_LAUNCH).astype("timedelta64[m]").astype("int64")
+    dates = pd.Series(FIRST_LAUNCH + random.integers(0, minutes, rows).astype("timedelta64[m]"))
+    # Older launches are without time, as in the real data
+    with_time = random.random(rows) < 0.97
+    formatted = np.where(with_time, dates.dt.strftime("%a %b %d, %Y %H:%M UTC"), dates.dt.strftime("%a %b %d, %Y"))
+
+    prices = np.round(random.uniform(5, 450, rows), 2).astype(str)
+    prices[random.random(rows) < 0.01] = "5,000.0"
+    prices = np.where(random.random(rows) < missing_price, None, prices)
+
+    details = (np.array(ROCKETS)[random.integers(0, len(ROCKETS), rows)].astype(object) + " | "
+               + np.array(PAYLOADS)[random.integers(0, len(PAYLOADS), rows)].astype(object))
+
+    index = np.arange(rows)
+    return pd.DataFrame({
+        "Unnamed: 0.1": index,
+        "Unnamed: 0": index,
+        "Organisation": np.array(ORGANISATIONS)[random.integers(0, len(ORGANISATIONS), rows)],
+        "Location": locations[random.integers(0, len(locations), rows)],
+        "Date": formatted,
+        "Detail": details,
+        "Rocket_Status": np.where(random.random(rows) < 0.18, "StatusActive", "StatusRetired"),
+        "Price": prices,
+        "Mission_Status": random.choice(MISSION_STATUSES, rows, p=MISSION_WEIGHTS),
+    }, columns=COLUMNS)
+
+
+def write_csv(path, rows, seed=0, chunksize=1_000_000):
+    # Written in chunks, 10^8 rows do not have to fit in memory
+    for number, start in enumerate(range(0, rows, chunksize)):
+        chunk = generate(min(chunksize, rows - start), seed + number)
+        chunk["Unnamed: 0.1"] += start
+        chunk["Unnamed: 0"] += start
+        chunk.to_csv(path, mode="w" if number == 0 else "a", header=number == 0, index=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic mission launches csv")
+    parser.add_argument("path")
+    parser.add_argument("rows", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_csv(args.path, args.rows, args.seed)
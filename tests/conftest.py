@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modules of the project are in the parent directory, e.g. "import query"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
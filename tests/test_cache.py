@@ -0,0 +1,19 @@
+from cache import load_cached, load_or_clean
+from prices import DEFAULT_PRICE_STRATEGY
+from synthetic import generate
+
+
+def test_same_file_name_in_other_directories(tmp_path):
+    # Both sources are cached side by side, neither invalidates the other
+    sources = []
+    for directory, rows in [("a", 50), ("b", 80)]:
+        (tmp_path / directory).mkdir()
+        source = str(tmp_path / directory / "launches.csv")
+        generate(rows).to_csv(source, index=False)
+        sources.append(source)
+    cache_dir = str(tmp_path / "cache")
+
+    cleaned = [load_or_clean(source, cache_dir) for source in sources]
+    for source, frame in zip(sources, cleaned):
+        cached = load_cached(source, cache_dir, params={"price_strategy": DEFAULT_PRICE_STRATEGY})
+        assert cached is not None and len(cached) == len(frame)
@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+
+from cleaning import payload_table, rocket_families, split_detail
+
+
+def _payloads(payload):
+    table = payload_table(pd.DataFrame({"Payload": [payload]}))
+    return table["Payload"].astype(str).tolist()
+
+
+@pytest.mark.parametrize("payload, expected", [
+    ("Starlink V1 L9 & BlackSky", ["Starlink V1 L9", "BlackSky"]),
+    ("Ziyuan-3 03, Apocalypse-10 & NJU-HKU 1", ["Ziyuan-3 03, Apocalypse-10", "NJU-HKU 1"]),
+    ("Look Ma, No Hands!", ["Look Ma, No Hands!"]),
+    ("Eutelsat 7C &  AT&T T-16", ["Eutelsat 7C", "AT&T T-16"]),
+    ("Yaogan 30 J, K & L", ["Yaogan 30 J, K & L"]),
+    ("Longjiang 1 & 2", ["Longjiang 1 & 2"]),
+    ("BeiDou-3 M19 & M20", ["BeiDou-3 M19 & M20"]),
+    ("NROL-13 (Intruder FA & 5B)", ["NROL-13 (Intruder FA & 5B)"]),
+    ("Jilin-1 07, 08 & Others", ["Jilin-1 07, 08"]),
+    ("SaudiSAT 5A, & 5B and Others", ["SaudiSAT 5A, & 5B"]),
+    ("Shiyan-6, Jiading-1 (OKW-01), & Others", ["Shiyan-6, Jiading-1 (OKW-01)"]),
+    ("Cartosat-3 & Rideshares", ["Cartosat-3"]),
+])
+def test_payloads(payload, expected):
+    assert _payloads(payload) == expected
+
+
+@pytest.mark.parametrize("name, family, variant", [
+    ("Falcon 9 Block 5", "Falcon 9", "Block 5"),
+    ("Long March 2D", "Long March 2", "D"),
+    ("Long March 11", "Long March 11", None),
+    ("Long March 3B/YZ-1", "Long March 3", "B/YZ-1"),
+    ("H-IIA 202", "H-IIA", "202"),
+    ("H-IIA 2024", "H-IIA", "2024"),
+    ("Antares 120", "Antares", "120"),
+    ("Antares 230", "Antares", "230"),
+    ("Atlas V 541", "Atlas V", "541"),
+    ("Delta II 7925-10C", "Delta II", "7925-10C"),
+    ("Kuaizhou 1", "Kuaizhou 1", None),
+    ("Kuaizhou 1A", "Kuaizhou 1", "A"),
+    ("Space Shuttle Atlantis", "Space Shuttle", "Atlantis"),
+    ("Space Shuttle Columbia", "Space Shuttle", "Columbia"),
+    ("Space Shuttle Endeavour", "Space Shuttle", "Endeavour"),
+    ("Thor-DM 18 Able I", "Thor-DM 18 Able I", None),
+    ("Ariane 5 ECA", "Ariane 5", "ECA"),
+    ("Proton-M/Briz-M", "Proton-M", "Briz-M"),
+    ("Cosmos-3M (11K65M)", "Cosmos-3M", "(11K65M)"),
+    ("GSLV Mk I", "GSLV Mk I", None),
+    ("GSLV Mk II", "GSLV Mk II", None),
+    ("GSLV Mk III", "GSLV Mk III", None),
+    ("Electron", "Electron", None),
+])
+def test_rocket_families(name, family, variant):
+    families, variants = rocket_families(pd.Series([name]))
+    assert families[0] == family
+    assert (variants[0] if pd.notna(variants[0]) else None) == variant
+
+
+def test_detail_without_payload():
+    frame = split_detail(pd.DataFrame({"Detail": [" Vostok-2M ", "Falcon 9 Block 5 | Starlink V1 L9 "]}))
+    assert frame["Rocket_Name"].tolist() == ["Vostok-2M", "Falcon 9 Block 5"]
+    assert frame["Payload"].isna().tolist() == [True, False]
+    assert frame["Payload"][1] == "Starlink V1 L9"
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from cleaning import clean_launches
+from incremental import LaunchStore
+from reliability import latest_reliability
+from synthetic import generate
+
+
+def _launches(rows=400):
+    cleaned = clean_launches(generate(rows))
+    return cleaned.sort_values("Date", kind="stable").reset_index(drop=True)
+
+
+def test_append_in_order(tmp_path):
+    launches = _launches()
+    store = LaunchStore.create(launches.iloc[:300], str(tmp_path))
+    store.append_cleaned(launches.iloc[300:])
+
+    store = LaunchStore(str(tmp_path))
+    assert len(store.load()) == store.cube.table["Launches"].sum() == len(launches)
+    pd.testing.assert_frame_equal(store.reliability["organisation"].summary().sort_index(),
+                                  latest_reliability(launches).sort_index())
+
+
+def test_append_older_launches_rebuilds_reliability(tmp_path):
+    launches = _launches()
+    store = LaunchStore.create(launches.iloc[100:], str(tmp_path))
+    store.append_cleaned(launches.iloc[:100])
+
+    store = LaunchStore(str(tmp_path))
+    history = store.load()
+    assert len(history) == store.cube.table["Launches"].sum() == len(launches)
+    for name, key in [("organisation", "Organisation"), ("family", "Rocket_Family")]:
+        pd.testing.assert_frame_equal(store.reliability[name].summary().sort_index(),
+                                      latest_reliability(history, key).sort_index())
@@ -0,0 +1,12 @@
+import pandas as pd
+
+from ingest import aggregate_csv
+from synthetic import write_csv
+
+
+def test_price_sums_do_not_depend_on_chunksize(tmp_path):
+    path = str(tmp_path / "launches.csv")
+    write_csv(path, 3000)
+    small = aggregate_csv(path, chunksize=250).price_sum
+    whole = aggregate_csv(path, chunksize=10000).price_sum
+    pd.testing.assert_series_equal(small.sort_index(), whole.sort_index(), rtol=1e-9)
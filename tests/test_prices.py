@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from prices import DEFAULT_PRICE, PriceImputer, impute_prices, price_fills
+
+
+def _launches():
+    # SpaceX has enough prices, RVSN USSR only two, Kenya none at all
+    rows = [("SpaceX", "USA", "Falcon 9", f"2020-01-{day:02d}", price)
+            for day, price in zip(range(1, 7), [50.0, 60.0, 70.0, np.nan, 80.0, 90.0])]
+    rows += [("NASA", "USA", "Saturn V", f"1969-0{month}-01", 1000.0) for month in range(1, 6)]
+    rows += [("RVSN USSR", "Russian Federation", "Energiya", "1987-05-15", 5000.0),
+             ("RVSN USSR", "Russian Federation", "Energiya", "1988-11-15", 5000.0),
+             ("RVSN USSR", "Russian Federation", "Vostok", "1961-04-12", np.nan),
+             ("Roscosmos", "Russian Federation", "Soyuz", "2010-01-01", 40.0),
+             ("Roscosmos", "Russian Federation", "Soyuz", "2011-01-01", 45.0),
+             ("Roscosmos", "Russian Federation", "Soyuz", "2012-01-01", 50.0),
+             ("ASI", "Kenya", "Scout", "1970-01-01", np.nan)]
+    return pd.DataFrame(rows, columns=["Organisation", "States", "Rocket_Name", "Date", "Price"]).assign(
+        Date=lambda frame: pd.to_datetime(frame["Date"]))
+
+
+def _filled(frame, organisation):
+    row = frame[(frame["Organisation"] == organisation) & (frame["Price_Source"] != "reported")].iloc[0]
+    return row["Price"], row["Price_Source"]
+
+
+def test_organisation_median():
+    assert _filled(impute_prices(_launches(), "organisation"), "SpaceX") == (70.0, "organisation")
+
+
+def test_group_with_few_prices_falls_through_to_state():
+    # Median of 5000, 5000, 40, 45, 50, not 5000 of the two Energiya launches
+    assert _filled(impute_prices(_launches(), "organisation"), "RVSN USSR") == (50.0, "state")
+
+
+def test_min_count():
+    filled = PriceImputer("organisation", min_count=2).fit_transform(_launches())
+    assert _filled(filled, "RVSN USSR") == (5000.0, "organisation")
+
+
+def test_state_without_prices_gets_constant():
+    for strategy in ["organisation", "state", "rocket", "interpolate", "constant"]:
+        assert _filled(impute_prices(_launches(), strategy), "ASI") == (DEFAULT_PRICE, "constant")
+
+
+def test_interpolate_between_known_prices():
+    assert _filled(impute_prices(_launches(), "interpolate"), "SpaceX") == (75.0, "interpolate")
+
+
+def test_rocket_without_enough_prices_falls_through():
+    assert _filled(impute_prices(_launches(), "rocket"), "SpaceX") == (70.0, "rocket")
+    assert _filled(impute_prices(_launches(), "rocket"), "RVSN USSR") == (50.0, "state")
+
+
+def test_fit_ignores_filled_prices():
+    history = impute_prices(_launches())
+    refit = PriceImputer().fit(history)
+    assert refit.medians["organisation"]["SpaceX"] == 70.0
+
+
+def test_price_fills():
+    fills = price_fills(impute_prices(_launches()))
+    assert fills.to_dict() == {"organisation": 1, "state": 1, "constant": 1}
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        PriceImputer("median")
+
+
+def test_partial_fit_of_chunks_is_the_same_as_fit():
+    launches = _launches()
+    for strategy in ["organisation", "rocket", "interpolate"]:
+        chunks = PriceImputer(strategy)
+        for start in range(0, len(launches), 4):
+            chunks.partial_fit(launches.iloc[start:start + 4])
+        pd.testing.assert_frame_equal(chunks.transform(launches), impute_prices(launches, strategy))
+
+
+def test_imputer_without_prices():
+    launches = _launches()
+    filled = PriceImputer().transform(launches)
+    assert (filled.loc[launches["Price"].isna(), "Price_Source"] == "constant").all()
@@ -0,0 +1,30 @@
+import pandas as pd
+
+from query import LaunchIndex
+
+
+def _index(dates):
+    return LaunchIndex(pd.DataFrame({
+        "Organisation": "SpaceX", "States": "USA", "Rocket_Name": "Falcon 9", "Rocket_Family": "Falcon",
+        "Mission_Status": "Success", "Location": "SLC-40, Cape Canaveral, Florida, USA",
+        "Date": pd.to_datetime(dates),
+    }))
+
+
+def test_end_without_time_includes_whole_day():
+    index = _index(["2020-08-06 23:59", "2020-08-07 00:00", "2020-08-07 05:12", "2020-08-08 00:00"])
+    assert index.count(start="2020-08-07", end="2020-08-07") == 2
+    assert index.count(end="2020-08-07") == 3
+    assert index.count(end=pd.Timestamp("2020-08-07")) == 3
+
+
+def test_end_with_time_is_inclusive_bound():
+    index = _index(["2020-08-07 00:00", "2020-08-07 05:12", "2020-08-07 05:13"])
+    assert index.count(end="2020-08-07 05:12") == 2
+    assert index.count(end="2020-08-07 00:00") == 1
+
+
+def test_years_include_whole_years():
+    index = _index(["2019-12-31 23:59", "2020-01-01 00:00", "2020-12-31 23:59", "2021-01-01 00:00"])
+    assert index.count(years=(2020, 2020)) == 2
+    assert index.count(years=(2020, None)) == 3
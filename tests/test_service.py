@@ -0,0 +1,67 @@
+import asyncio
+import os
+import shutil
+import threading
+
+import pandas as pd
+import pytest
+
+from pipeline import DATA_PATH
+from query import LaunchIndex
+from service import AnalyticsService, parse_filters
+
+
+def test_dates_are_passed_as_given():
+    # "00:00" is an exact end, not the whole day
+    filters = parse_filters({"start": ["2020-08-06"], "end": ["2020-08-06 00:00"]})
+    assert filters == {"start": "2020-08-06", "end": "2020-08-06 00:00"}
+
+
+def test_end_with_midnight_time_is_exact():
+    index = LaunchIndex(pd.DataFrame({
+        "Organisation": "SpaceX", "States": "USA", "Rocket_Name": "Falcon 9", "Rocket_Family": "Falcon 9",
+        "Mission_Status": "Success", "Location": "SLC-40, Cape Canaveral, Florida, USA",
+        "Date": pd.to_datetime(["2020-08-06 00:00", "2020-08-06 05:12"])}))
+    assert index.count(**parse_filters({"start": ["2020-08-06 00:00"], "end": ["2020-08-06 00:00"]})) == 1
+    assert index.count(**parse_filters({"start": ["2020-08-06"], "end": ["2020-08-06"]})) == 2
+
+
+@pytest.mark.parametrize("value", ["abc", "nat"])
+def test_wrong_date_is_value_error(value):
+    with pytest.raises(ValueError):
+        parse_filters({"start": [value]})
+
+
+def test_changed_data_is_loaded_without_blocking(tmp_path, monkeypatch):
+    source = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), DATA_PATH)
+    monkeypatch.chdir(tmp_path)
+    shutil.copy(source, "launches.csv")
+    service = AnalyticsService("launches.csv")
+    load = service._load
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_load(version):
+        started.set()
+        release.wait(10)
+        return load(version)
+
+    service._load = slow_load
+
+    async def requests():
+        status, before = await service.handle("/launches/organisation", {})
+        with open("launches.csv") as file:
+            lines = file.readlines()
+        with open("launches.csv", "w") as file:
+            file.writelines(lines[:-1000])
+        service.checked = 0.0
+        # Served from the old data while the new one is loaded in thread
+        status, during = await service.handle("/launches/organisation", {})
+        assert during == before and started.wait(10)
+        release.set()
+        await service.reloading
+        await asyncio.sleep(0)           # Done callback of the load
+        status, after = await service.handle("/launches/organisation", {})
+        assert service.reloading is None and sum(after.values()) < sum(before.values())
+
+    asyncio.run(requests())
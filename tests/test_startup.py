@@ -0,0 +1,8 @@
+from benchmark import PLOTTING_MODULES, STARTUP_ARGS, STARTUP_BUDGET, startup
+
+
+def test_text_summary_starts_fast_without_plotting_modules():
+    # main.py --summary in new interpreter, the best of three runs with cached cleaned data
+    seconds, imported = startup(STARTUP_ARGS, repeat=3)
+    assert imported == [], f"{PLOTTING_MODULES} must not be imported, imported: {imported}"
+    assert seconds <= STARTUP_BUDGET, f"Start-up took {seconds:.3f} s, budget is {STARTUP_BUDGET} s"
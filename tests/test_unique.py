@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+from unique import map_unique
+
+
+def test_func_runs_once_per_unique_value():
+    calls = []
+
+    def upper(unique):
+        calls.append(list(unique))
+        return [value.upper() for value in unique]
+
+    result = map_unique(pd.Series(["b", "a", None, "b"], index=[5, 6, 7, 8], name="letters"), upper)
+    assert calls == [["a", "b"]]
+    assert result.name == "letters" and result.index.tolist() == [5, 6, 7, 8]
+    assert result[[5, 6, 8]].tolist() == ["B", "A", "B"] and pd.isna(result[7])
+
+
+def test_dates_and_frames():
+    dates = map_unique(["2020-01-01", np.nan], pd.to_datetime, dtype="datetime64[ns]")
+    assert dates.dtype == "datetime64[ns]" and dates.isna().tolist() == [False, True]
+
+    frame = map_unique(["x", None], lambda unique: pd.DataFrame({"Value": list(unique)}))
+    assert frame["Value"].tolist()[0] == "x" and pd.isna(frame["Value"][1])
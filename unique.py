@@ -0,0 +1,18 @@
+import pandas as pd
+
+
+def map_unique(values, func, dtype=object):
+    """func of every value, computed only for the unique values and broadcast back through categorical codes.
+
+    func takes Index of unique values and returns the same number of results, array or DataFrame.
+    Missing values give missing result: NaN, NaT or row of NaN.
+    """
+    values = pd.Series(values)
+    categorical = pd.Categorical(values)
+    mapped = func(categorical.categories)
+    if not isinstance(mapped, pd.DataFrame):
+        mapped = pd.Series(mapped, dtype=dtype, name=values.name)
+    # Code -1 of missing value is not in the index, reindex makes it missing
+    result = mapped.reset_index(drop=True).reindex(categorical.codes)
+    result.index = values.index
+    return result